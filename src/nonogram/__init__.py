@@ -1,3 +1,3 @@
 
 from .gram import Nonogram
-from .grid import Nonogrid, NonogridArray
+from .grid import Nonogrid, NonogridArray, NonogridBitset
@@ -1,7 +1,114 @@
 """Representations of nonogram clues and puzzles."""
 
-# TODO: Nonoclues are mutable; do we need to add sanity checks if the list is mutated
-#  or should I just make the list immutable?
+from functools import lru_cache, partial
+from itertools import chain
+from operator import call, contains, getitem
+
+from nonogram.lines import num_solutions, pack_mask, solution_mask_set, solution_masks
+
+
+@lru_cache(maxsize=1 << 16)
+def _line_satisfied(hints, mask):
+    """Verification kernel behind :py:meth:`Nonoclue.satisfied_by_mask`.
+
+    Operates only on a tuple of hints and an integer so that solvers can call it
+    in their inner loops without any :py:class:`Nonoclue` attribute or method lookups.
+
+    Notes
+    -----
+    The kernel is pure and its arguments are hashable, so results are memoized.
+    Backtracking solvers verify the same few lines against the same clues repeatedly,
+    and a hit is a single dictionary lookup shared by every clue with the same hints.
+    The cache is bounded since a wide line has too many possible masks to store.
+    """
+    num_hints, cur_hint = len(hints), 0
+    if num_hints < 2:  # most clues have zero or one hint and need no loop
+        if not num_hints:
+            return not mask
+        # A single run has no set bits left once the carry clears it.
+        return not mask & (mask + (mask & -mask)) and mask.bit_count() == hints[0]
+    # Lines that differ from a solution by a few squares, which backtracking produces the most,
+    # usually have the wrong number of filled squares, so reject them before walking the runs.
+    if mask.bit_count() != sum(hints):
+        return False
+
+    while mask:
+        end = mask + (mask & -mask)
+        if (cur_hint == num_hints or  # line should not exist
+                (end ^ mask).bit_count() - 1 != hints[cur_hint]):
+            return False
+        cur_hint += 1
+        mask &= end  # clear the run we just matched
+
+    # Did we see all the expected lines?
+    return cur_hint == num_hints
+
+
+_MAX_LINE_SET_SIZE = 1 << 12
+"""Largest number of solutions to a clue that :py:func:`_line_set` enumerates into a set."""
+
+
+def _line_set(hints, length):
+    """Set of every mask of the given length that satisfies `hints`, if it is small enough.
+
+    Returns the cached set of solution masks from
+    :py:func:`~nonogram.lines.solution_mask_set`, so that verifying a line
+    is a single hash lookup, or ``None`` if the clue has more than
+    :py:data:`_MAX_LINE_SET_SIZE` solutions.
+    """
+    if num_solutions(hints, length) > _MAX_LINE_SET_SIZE:
+        return None
+    return solution_mask_set(hints, length)
+
+
+_MAX_TABLE_LENGTH = 16
+"""Longest line that :py:func:`_line_table` tabulates (a table has one byte per mask)."""
+
+
+@lru_cache(maxsize=256)
+def _line_table(hints, length):
+    """Table with a byte for every mask of the given length that is 1 if the mask satisfies `hints`.
+
+    Notes
+    -----
+    Indexing a byte string is slightly cheaper than a hash lookup in the solution set,
+    and the table is filled from the solutions alone instead of verifying all
+    :math:`2^{length}` masks.
+    """
+    table = bytearray(1 << length)
+    for mask in solution_masks(hints, length):
+        table[mask] = 1
+    return bytes(table)
+
+
+def _axis_checks(hints_seq, length):
+    """Lookup and per-clue lookup structures that verify the lines of one axis of a nonogram.
+
+    Returns
+    -------
+    (lookup : Callable[[Any, int], Any], checks : tuple)
+        ``lookup(checks[i], mask)`` is truthy if and only if `mask` satisfies ``hints_seq[i]``.
+        Lines up to :py:data:`_MAX_TABLE_LENGTH` squares are checked by indexing a
+        :py:func:`_line_table` and longer lines by membership in a :py:func:`_line_set`.
+
+    Notes
+    -----
+    If some clue on a long axis has too many solutions for a set, every clue on the axis is
+    checked by calling a function instead: the bound ``__contains__`` of its set,
+    or the verification kernel partially applied to its hints.
+    Both are implemented in C, so the lookups still never run any bytecode.
+    """
+    if length <= _MAX_TABLE_LENGTH:
+        return getitem, tuple(_line_table(hints, length) for hints in hints_seq)
+    line_sets = [_line_set(hints, length) for hints in hints_seq]
+    if None not in line_sets:
+        return contains, tuple(line_sets)
+    return call, tuple(
+        partial(_line_satisfied, hints) if line_set is None else line_set.__contains__
+        for hints, line_set in zip(hints_seq, line_sets)
+    )
+
+
 class Nonoclue:
     """A clue to either a row or column of a nonogram puzzle.
 
@@ -9,33 +116,34 @@ class Nonoclue:
     A clue of the form *(a, b, c)* imposes exactly lines of length *a*, *b*, and *c* filled
     squares separated by at least one empty square.
 
-    Represents the clue *(0)* (all squares empty) as the empty list ``[]`` to minimize edge cases
+    Represents the clue *(0)* (all squares empty) as the empty tuple ``()`` to minimize edge cases
     for the solver.
+    Clues are immutable, so equal clues hash equally and can be shared or used as keys.
     """
 
+    __slots__ = ("clue", "_hash", "_min_length")
+
     @staticmethod
-    def _init_clue(stack):
-        """Initialize a clue with a stack (LIFO).
+    def _flatten(items):
+        """Yield the integers in `items`, recursing into any nested iterables.
 
         This implementation recurses on iterables in *args that contain iterables,
         but the user shouldn't assume that functionality.
         """
-        clue = []
-
-        while stack:
-            itm = stack.pop()
-            try:
-                # test for integer conversion before iteration because of strings
-                num = int(itm)
-                if num < 0:
-                    raise ValueError("Negative numbers are not valid clues.")
-                if num > 0:  # 0 is a valid clue that is equivalent to an empty clue, so ignore.
-                    clue.append(num)
-            except TypeError:
-                stack += reversed(itm)  # handle lists from low-index to high-index
-
-        return clue
-
+        for itm in items:
+            if type(itm) is int:
+                yield itm
+            # strings are iterable, but convert them (and bools) to integers instead
+            elif isinstance(itm, (int, str)):
+                yield int(itm)
+            else:
+                try:
+                    # iter() also accepts sequences like Nonoclue that only define __getitem__
+                    nested = iter(itm)
+                except TypeError:
+                    yield int(itm)
+                else:
+                    yield from Nonoclue._flatten(nested)
 
     def __init__(self, *args):
         """Create a nonoclue by concatenating any iterables in `*args` into a list of integers.
@@ -47,15 +155,29 @@ class Nonoclue:
         ValueError
             If any integer in the nonoclue is negative.
         """
-        # The container list ensures *args is reversed on the stack.
-        self.clue: list[int] = Nonoclue._init_clue([args])
+        # Fast path for the common calls Nonoclue([a, b, c]) and Nonoclue(a, b, c),
+        # which would otherwise dispatch on the type of every hint in _flatten.
+        flat = args[0] if len(args) == 1 and type(args[0]) in (list, tuple) else args
+        if not all(type(itm) is int for itm in flat):
+            # Flatten a single level of lists and tuples, e.g. Nonoclue(1, [2, 3]), at C level.
+            flat = list(chain.from_iterable(
+                itm if type(itm) in (list, tuple) else (itm,) for itm in flat))
+            if not all(type(itm) is int for itm in flat):
+                flat = list(Nonoclue._flatten(args))
+        if any(itm < 0 for itm in flat):
+            raise ValueError("Negative numbers are not valid clues.")
+        # 0 is a valid clue that is equivalent to an empty clue, so ignore it.
+        self.clue: tuple[int, ...] = tuple(itm for itm in flat if itm)
+        self._hash = hash(self.clue)
+        # Shortest line that fits the clue: every filled square plus one gap between lines.
+        self._min_length = sum(self.clue) + max(0, len(self.clue) - 1)
 
     def __len__(self):
         """Number of continuous lines of filled-in squares in the clue."""
         return len(self.clue)
 
     def __repr__(self):
-        return f"{type(self).__name__}({self.clue})"
+        return f"{type(self).__name__}({list(self.clue)})"
 
     def __getitem__(self, key):
         return self.clue[key]
@@ -65,11 +187,8 @@ class Nonoclue:
             return NotImplemented
         return self.clue == other.clue
 
-    @staticmethod
-    def _bool_iter(sequence):
-        for itm in sequence:
-            yield bool(itm)
-        yield False
+    def __hash__(self):
+        return self._hash
 
     def satisfied_by(self, sequence):
         """Determine if a boolean sequence satisfies the nonoclue.
@@ -86,31 +205,92 @@ class Nonoclue:
         Notes
         -----
         - Nonoclues themselves do not impose a total length.
+        - Sequences shorter than the shortest line that fits the clue are rejected
+          before any square is read.
+
+        See Also
+        --------
+        :py:meth:`Nonoclue.satisfied_by_mask`
         """
-        cur_hint = 0
-        line = 0
+        if not self.clue:
+            return not any(sequence)
+        squares = sequence if isinstance(sequence, (list, tuple)) else list(sequence)
+        if len(squares) < self._min_length:
+            return False
+        return _line_satisfied(self.clue, pack_mask(squares))
+
+    def satisfied_by_mask(self, mask, length=None):
+        """Determine if a line packed into the bits of an integer satisfies the nonoclue.
+
+        Parameters
+        ----------
+        mask : int
+            Non-negative integer whose bit *i* is set if and only if square *i* is filled.
+        length : int, optional
+            Number of squares in the line.
+            If given, lines shorter than the clue are rejected without verifying `mask`,
+            as in :py:meth:`satisfied_by`.
+
+        Returns
+        -------
+        If the clue's constraints are satisfied by `mask`.
+
+        Raises
+        ------
+        ValueError
+            If `mask` is negative, or if `length` is given and `mask` has a bit set
+            past the end of the line.
 
-        # TODO: Fail this as early as possible.
-        # DepTODO: Provide additional context around where it fails.
-        for square in Nonoclue._bool_iter(sequence):
-            line += square
-            if not square and line > 0:  # non-empty line finished
-                if (cur_hint == len(self) or  # line should not exist
-                        line != self[cur_hint]):
-                    return False
-                cur_hint += 1
-                line = 0
+        Notes
+        -----
+        Each iteration consumes an entire run of filled squares instead of a single square.
+        Adding the lowest set bit ``mask & -mask`` to `mask` carries through the lowest run,
+        so the bits that differ between ``mask`` and the sum are exactly that run and the
+        bit after it.
 
-        # Did we see all the expected lines?
-        return cur_hint == len(self)
+        Since the run lengths are read from the least significant bit,
+        square 0 is the first square of the line.
+        """
+        if mask < 0:
+            raise ValueError(f"Mask {mask} is negative.")
+        if length is not None:
+            if mask >> length:
+                raise ValueError(f"Mask {mask:#b} has squares past the end of a line "
+                                 f"of length {length}.")
+            if length < self._min_length:
+                return False
+        return _line_satisfied(self.clue, mask)
 
 
 class Nonogram:
-    """The row clues and column clues that form a nonogram puzzle."""
+    """The row clues and column clues that form a nonogram puzzle.
+
+    Attributes
+    ----------
+    height : int
+        Total number of rows (i.e., number of squares in a column).
+    width : int
+        Total number of columns (i.e., number of squares in a row).
+
+    Notes
+    -----
+    The dimensions are fixed once the clues are trimmed, so they are stored as plain attributes
+    instead of properties that would be recomputed by a function call on every access.
+    """
+
+    __slots__ = ("_rows", "_cols", "_row_hints", "_col_hints", "_line_checks", "height", "width")
 
     @staticmethod
-    def _init_clues(clue_seq):
-        clues = [elem if isinstance(elem, Nonoclue) else Nonoclue(elem) for elem in clue_seq]
+    def _init_clues(clue_seq, interned):
+        """Cast and trim a sequence of clues, reusing one instance for all equal clues.
+
+        `interned` maps the type and hints of a clue to the instance that every equal clue
+        of the same type is replaced with, so it is shared between the rows and the columns.
+        Keying by type keeps instances of subclasses from being replaced by plain clues.
+        """
+        clues = [interned.setdefault((type(clue), clue.clue), clue)
+                 for clue in (elem if isinstance(elem, Nonoclue) else Nonoclue(elem)
+                              for elem in clue_seq)]
 
         start_idx, end_idx = 0, len(clues)
         while start_idx < end_idx and not clues[start_idx]:
@@ -119,7 +299,7 @@ class Nonogram:
             end_idx -= 1
 
         if start_idx == end_idx:
-            return [Nonoclue()]
+            return (Nonoclue(),)
         return tuple(clues[start_idx:end_idx])
 
     def __init__(self, rows, cols):
@@ -141,7 +321,13 @@ class Nonogram:
 
         Better to defer all solution verification to the solver.
         """
-        self._rows, self._cols = Nonogram._init_clues(rows), Nonogram._init_clues(cols)
+        interned = {}
+        self._rows = Nonogram._init_clues(rows, interned)
+        self._cols = Nonogram._init_clues(cols, interned)
+        self.height, self.width = len(self._rows), len(self._cols)
+        self._row_hints = tuple(clue.clue for clue in self._rows)
+        self._col_hints = tuple(clue.clue for clue in self._cols)
+        self._line_checks = None  # built on the first verification
 
     @property
     def rows(self):
@@ -153,16 +339,6 @@ class Nonogram:
         """Tuple containing the column clues of this nonogram."""
         return self._cols
 
-    @property
-    def height(self):
-        """Total number of rows (i.e., number of squares in a column)."""
-        return len(self.rows)
-
-    @property
-    def width(self):
-        """Total number of columns (i.e., number of squares in a row)."""
-        return len(self.cols)
-
     @property
     def dims(self):
         """Nonogram dimensions as a tuple *(height, width)*."""
@@ -176,20 +352,39 @@ class Nonogram:
     def __repr__(self):
         return f"{type(self).__name__}({self.rows}, {self.cols})"
 
+    def _get_line_checks(self):
+        """Lookups that verify the row clues and the column clues; see :py:func:`_axis_checks`."""
+        if self._line_checks is None:
+            self._line_checks = (_axis_checks(self._row_hints, self.width),
+                                 _axis_checks(self._col_hints, self.height))
+        return self._line_checks
+
     @staticmethod
-    def _clue_sat_count(clues, data_iter):
-        """Determine how many clues an iterator over data satisfies.
+    def _clue_sat_count(axis_checks, masks):
+        """Determine how many clues of an axis a sequence of line masks satisfies.
 
         Raises
         ------
         ValueError
-            If the lengths of `clues` and `data_iter` do not match.
+            If the number of clues and the number of masks do not match.
+
+        Notes
+        -----
+        Mapping the lookup over both sequences dispatches every check from C,
+        instead of resuming a generator expression for every clue.
         """
-        zipped = zip(clues, data_iter, strict=True)
-        return sum(clue.satisfied_by(line) for clue, line in zipped)
+        lookup, checks = axis_checks
+        if len(checks) != len(masks):
+            raise ValueError(f"Expected {len(checks)} line masks but got {len(masks)}.")
+        return sum(map(lookup, checks, masks))
 
     # TODO: Write fitting algorithm to call as a static method.
 
+    def _check_dims(self, grid):
+        if self.dims != grid.dims:
+            raise ValueError(f"Dimensions (height, width) of grid {grid.dims} "
+                             f"do not match nonogram {self.dims}.")
+
     def satisfied_count(self, grid):
         """Determine how many clues in the nonogram are satisfied by a nonogrid.
 
@@ -204,13 +399,13 @@ class Nonogram:
             If the height and width of the grid and nonogram do not match.
         """
         # TODO: Add 'fit' or 'strict' parameter to this method instead of always raising.
-        if self.dims != grid.dims:
-            raise ValueError(f"Dimensions (height, width) of grid {grid.dims} "
-                             f"do not match nonogram {self.dims}.")
+        self._check_dims(grid)
 
-        row_clue_count = Nonogram._clue_sat_count(self.rows, grid.rows())
-        col_clue_count = Nonogram._clue_sat_count(self.cols, grid.cols())
-        return row_clue_count + col_clue_count
+        # Grids pack their own lines, so grids that already store bitmasks skip packing entirely.
+        row_masks, col_masks = grid.line_masks()
+        row_checks, col_checks = self._get_line_checks()
+        return (Nonogram._clue_sat_count(row_checks, row_masks)
+                + Nonogram._clue_sat_count(col_checks, col_masks))
 
 
     def satisfied_by(self, grid):
@@ -230,9 +425,17 @@ class Nonogram:
         ValueError
             If the height and width of the grid and nonogram do not match.
 
+        Notes
+        -----
+        Stops at the first clue that is not satisfied instead of counting every clue,
+        and only packs the columns of the grid if every row clue is satisfied.
+
         See Also
         --------
         :py:meth:`Nonogram.satisfied_count`
         """
         # TODO: Add 'fit' or 'strict' parameter to this method.
-        return self.satisfied_count(grid) == self.num_clues
+        self._check_dims(grid)
+        (row_lookup, row_checks), (col_lookup, col_checks) = self._get_line_checks()
+        return (all(map(row_lookup, row_checks, grid.row_masks()))
+                and all(map(col_lookup, col_checks, grid.col_masks())))
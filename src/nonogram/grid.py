@@ -1,7 +1,27 @@
 """Representations for nonogram solutions."""
 
 from abc import ABC, abstractmethod
-from functools import wraps
+from itertools import batched, chain, islice, repeat
+
+from nonogram.lines import pack_mask, unpack_mask
+
+
+def _transpose_masks(row_masks, width):
+    """Turn the bitmask of every row into the bitmask of every column.
+
+    Notes
+    -----
+    Formats every row as a binary string and zips the strings,
+    so each column mask is parsed back with a single ``int`` call
+    instead of extracting its bits one square at a time.
+    The binary strings put the last square first, so the rows are formatted in reverse
+    and the columns come out in reverse.
+    """
+    if not row_masks or not width:  # format always writes at least one digit
+        return [0] * width
+    fmt = f"0{width}b"
+    transposed = zip(*[format(mask, fmt) for mask in reversed(row_masks)])
+    return [int("".join(col), 2) for col in transposed][::-1]
 
 
 class Nonogrid(ABC):
@@ -9,6 +29,13 @@ class Nonogrid(ABC):
 
     Provide read-write access to individual elements by indexing on a tuple ``grid[r,c]``.
 
+    Attributes
+    ----------
+    height : int
+        Number of rows in the nonogram grid.
+    width : int
+        Number of columns in the nonogram grid.
+
     Notes
     -----
     Indexing with a tuple provides numerous benefits, even though it is unintuitive for the user:
@@ -19,28 +46,15 @@ class Nonogrid(ABC):
     - Enforces using the :py:meth:`~Nonogrid.row` and :py:meth:`~Nonogrid.col` methods for symmetry
       by not providing access to a row index.
 
-    The methods :py:meth:`Nonogrid.row`, :py:meth:`Nonogrid.col`, :py:meth:`Nonogrid.rows`,
-    and :py:meth:`Nonogrid.cols` all return iterators.
+    The methods :py:meth:`Nonogrid.row` and :py:meth:`Nonogrid.col` return new lists,
+    and :py:meth:`Nonogrid.rows` and :py:meth:`Nonogrid.cols` return iterators over those lists.
 
-    - Returning a list could mislead users into thinking these methods can mutate the entire row.
+    - Callers almost always consume entire lines, so building a list at once is cheaper than
+      resuming a generator for every square.
+    - The lists are copies; mutating them does not mutate the grid.
     """
 
-    def _infinite_generator(self, iterator, default=None):
-        """Yield values from an iterator and then a default value ad infinitum.
-
-        This is an **infinite** iterator and should *not* be used in a loop.
-
-        Parameters
-        ----------
-        iterator : Iterator
-            Yield values from `iterator` until it is empty.
-        default : Any, default=None
-            Yield `default` infinitely many times after `iterator` is emptied.
-            Instead yield this instance's default value if `default` is ``None``.
-        """
-        yield from iterator
-        while True:
-            yield self._default_val if default is None else default
+    __slots__ = ("height", "width", "_default_val")
 
     def __init__(self, height, width, *, default_val=None):
         """Initialize a nonogrid and optionally fill in initial data.
@@ -59,7 +73,7 @@ class Nonogrid(ABC):
         `default_val` is a keyword-only argument so subclasses can flexibly use
         positional arguments to get data in multiple different ways.
         """
-        self._height, self._width = height, width
+        self.height, self.width = height, width
         self._default_val = default_val
 
     @classmethod
@@ -70,41 +84,14 @@ class Nonogrid(ABC):
         """
         return cls(nonogram.height, nonogram.width, *args, **kwargs)
 
-    @property
-    def height(self):
-        """Number of rows in the nonogram grid."""
-        return self._height
-
-    @property
-    def width(self):
-        """Number of columns in the nonogram grid."""
-        return self._width
-
     @property
     def dims(self):
         """Grid dimensions as a tuple *(height, width)*."""
         return self.height, self.width
 
-    @staticmethod
-    def _idx_validation(f):
-        """Add an index validation checker to a method from a subclass of :py:class:`Nonogrid`.
-
-        The function's first two arguments must be ``self`` and ``idx``,
-        where ``self`` accepts an instance of the subclass and ``idx``
-        accepts a 2-tuple ``(row, col)`` that is the index to access.
-
-        Intended for use with consistency across subclasses' implementations
-        of :py:meth:`Nonogrid.__getitem__` and :py:meth:`Nonogrid.__setitem__`
-        """
-        @wraps(f)
-        def wrapper(self, idx, *args, **kwargs):
-            r, c = idx
-            if not (0 <= r < self.height and 0 <= c < self.width):
-                raise IndexError(f"Index (row={r}, col={c}) invalid for "
-                                 f"grid dimensions ()")
-            return f(self, idx, *args, **kwargs)
-
-        return wrapper
+    def _validate_line(self, idx, length, axis):
+        if not 0 <= idx < length:
+            raise IndexError(f"Index ({axis}={idx}) invalid for grid dimensions {self.dims}")
 
     @abstractmethod
     def __getitem__(self, idx: tuple[int, int]):
@@ -114,15 +101,31 @@ class Nonogrid(ABC):
     def __setitem__(self, idx: tuple[int, int], val):
         """Set value in the grid at `idx` ``(row,col)`` to `val`."""
 
+    def _get(self, r, c):
+        """Get the value at ``(r, c)`` without validating the index.
+
+        The line methods validate their index once and then call this method for every square.
+        Subclasses should override it with direct access to their storage;
+        the default falls back to (validated) indexing.
+        """
+        return self[r,c]
+
+    def _set(self, r, c, val):
+        """Set the value at ``(r, c)`` to `val` without validating the index.
+
+        See :py:meth:`Nonogrid._get`.
+        """
+        self[r,c] = val
+
     def row(self, r):
-        """Iterator over the row of values at a given index."""
-        for c in range(self.width):
-            yield self[r,c]
+        """List of the values in the row at a given index."""
+        self._validate_line(r, self.height, "row")
+        return [self._get(r, c) for c in range(self.width)]
 
     def col(self, c):
-        """Iterator over the row of values at a given index."""
-        for r in range(self.height):
-            yield self[r,c]
+        """List of the values in the column at a given index."""
+        self._validate_line(c, self.width, "col")
+        return [self._get(r, c) for r in range(self.height)]
 
     def set_row(self, r, data, default_val=None):
         """Fill a row with values from an iterable.
@@ -148,9 +151,10 @@ class Nonogrid(ABC):
         If ``None`` is going to be a valid entry in a solver, we expect any reasonable use case
         to let ``None`` be the default value in the entire grid.
         """
-        data_iter = self._infinite_generator(data, default_val)
-        for c in range(self.width):
-            self[r,c] = next(data_iter)
+        self._validate_line(r, self.height, "row")
+        pad = self._default_val if default_val is None else default_val
+        for c, val in zip(range(self.width), chain(data, repeat(pad))):
+            self._set(r, c, val)
 
     def set_col(self, c, data, default_val=None):
         """Fill a column with values from an iterable.
@@ -158,30 +162,101 @@ class Nonogrid(ABC):
         See :py:meth:`Nonogrid.set_row` for parameter details,
         replacing ``r`` with ``c`` and "row" with "column".
         """
-        data_iter = self._infinite_generator(next(data), default_val)
-        for r in range(self.height):
-            self[r,c] = next(data_iter)
+        self._validate_line(c, self.width, "col")
+        pad = self._default_val if default_val is None else default_val
+        # zip stops at the last row before pulling another value out of `data`
+        for r, val in zip(range(self.height), chain(data, repeat(pad))):
+            self._set(r, c, val)
+
+    def row_mask(self, r):
+        """Row at a given index packed into an integer with bit *c* set if square *c* is filled.
+
+        See Also
+        --------
+        :py:meth:`nonogram.gram.Nonoclue.satisfied_by_mask`
+        """
+        return pack_mask(self.row(r))
+
+    def col_mask(self, c):
+        """Column at a given index packed into an integer with bit *r* set if square *r* is filled.
+
+        See Also
+        --------
+        :py:meth:`nonogram.gram.Nonoclue.satisfied_by_mask`
+        """
+        return pack_mask(self.col(c))
+
+    def row_masks(self):
+        """List of every row packed into an integer with bit *c* set if square *c* is filled.
+
+        See Also
+        --------
+        :py:meth:`nonogram.gram.Nonoclue.satisfied_by_mask`
+        """
+        return list(map(pack_mask, self.rows()))
+
+    def col_masks(self):
+        """List of every column packed into an integer with bit *r* set if square *r* is filled.
+
+        See Also
+        --------
+        :py:meth:`nonogram.gram.Nonoclue.satisfied_by_mask`
+        """
+        return list(map(pack_mask, self.cols()))
+
+    def line_masks(self):
+        """Lists of every row mask and every column mask, reading each square only once.
+
+        Returns
+        -------
+        (row_masks : list[int], col_masks : list[int])
+            The results of :py:meth:`Nonogrid.row_masks` and :py:meth:`Nonogrid.col_masks`.
+
+        Notes
+        -----
+        The column masks are transposed from the row masks instead of packed from
+        a second, strided pass over the grid.
+        """
+        row_masks = self.row_masks()
+        return row_masks, _transpose_masks(row_masks, self.width)
 
     def rows(self):
         """Iterate over all rows in the grid."""
-        for r in range(self.height):
-            yield self.row(r)
+        return map(self.row, range(self.height))
 
     def cols(self):
         """Iterate over all columns in the grid."""
-        for c in range(self.width):
-            yield self.col(c)
+        return map(self.col, range(self.width))
 
     def __repr__(self):
         return (f"{type(self).__name__}("
                 f"{self.height}, "
                 f"{self.width}, "
-                f"default_val={self._default_val}"
+                f"default_val={self._default_val}, "
+                f"data={list(self.rows())}"
                 f")")
 
+    def __str__(self):
+        # TODO can I write a smart __str__ that makes a nice grid?
+        return str(list(self.rows()))
+
 
 class NonogridArray(Nonogrid):
-    """Nonogrid implemented with an data array."""
+    """Nonogrid implemented with a flat, row-major data array.
+
+    Notes
+    -----
+    Square ``(r, c)`` is stored at index ``r * width + c`` of a single list,
+    so each access is one list lookup instead of one per row list and one per square.
+    Rows are contiguous slices and columns are the extended slices ``[c::width]``,
+    which are both copied at C level.
+
+    A flat index can wrap around into another row, so public indexing checks indices inline;
+    the line methods validate their index once and use the unchecked :py:meth:`_get`
+    and :py:meth:`_set` for every square.
+    """
+
+    __slots__ = ("_grid",)
 
     # TODO: add initialization method that infers height and width from data
     # TODO: add strict parameter
@@ -200,38 +275,249 @@ class NonogridArray(Nonogrid):
             Default value with which to fill in the initial grid.
         """
         super().__init__(height, width, default_val=default_val)
-        self._grid = []
 
-        row_iter = self._infinite_generator(data, [])
-        for r in range(self.height):
-            self._grid.append([None] * self.width)
-            self.set_row(r, next(row_iter))
+        # Concatenate each row of data, padded or truncated to the width, into one list.
+        rows = islice(chain(data, repeat(())), self.height)
+        self._grid = list(chain.from_iterable(
+            islice(chain(row, repeat(default_val)), self.width) for row in rows))
 
-    @Nonogrid._idx_validation
     def __getitem__(self, idx: tuple[int, int]):
         r, c = idx
-        return self._grid[r][c]
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise IndexError(f"Index (row={r}, col={c}) invalid for grid dimensions {self.dims}")
+        return self._grid[r * self.width + c]
 
-    @Nonogrid._idx_validation
     def __setitem__(self, idx: tuple[int, int], val):
         r, c = idx
-        self._grid[r][c] = val
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise IndexError(f"Index (row={r}, col={c}) invalid for grid dimensions {self.dims}")
+        self._grid[r * self.width + c] = val
+
+    def _get(self, r, c):
+        return self._grid[r * self.width + c]
+
+    def _set(self, r, c, val):
+        self._grid[r * self.width + c] = val
+
+    def row(self, r):
+        """List of the values in the row at a given index.
+
+        Copies the row's contiguous slice of the underlying array.
+        """
+        self._validate_line(r, self.height, "row")
+        start = r * self.width
+        return self._grid[start:start + self.width]
+
+    def col(self, c):
+        """List of the values in the column at a given index.
+
+        Copies every `width`-th value of the underlying array, starting from `c`.
+        """
+        self._validate_line(c, self.width, "col")
+        return self._grid[c::self.width]
+
+    def rows(self):
+        """Iterate over all rows in the grid.
+
+        Splits the underlying array into rows at C level
+        instead of validating and slicing every row index.
+        """
+        if not self.width:
+            return ([] for _ in range(self.height))
+        return map(list, batched(self._grid, self.width))
+
+    def cols(self):
+        """Iterate over all columns in the grid."""
+        return (self._grid[c::self.width] for c in range(self.width))
+
+    def set_row(self, r, data, default_val=None):
+        """Fill a row with values from an iterable.
+
+        Replaces the row's slice with a single slice assignment.
+        See :py:meth:`Nonogrid.set_row` for parameter details.
+        """
+        self._validate_line(r, self.height, "row")
+        pad = self._default_val if default_val is None else default_val
+        start = r * self.width
+        self._grid[start:start + self.width] = islice(chain(data, repeat(pad)), self.width)
+
+    def set_col(self, c, data, default_val=None):
+        """Fill a column with values from an iterable.
+
+        Replaces the column's extended slice with a single slice assignment.
+        See :py:meth:`Nonogrid.set_col` for parameter details.
+        """
+        self._validate_line(c, self.width, "col")
+        pad = self._default_val if default_val is None else default_val
+        # islice stops at the last row before pulling another value out of `data`
+        self._grid[c::self.width] = list(islice(chain(data, repeat(pad)), self.height))
 
     def __copy__(self):
-        return type(self)(self.height, self.width, self.rows(), default_val=self._default_val)
+        grid = type(self)(self.height, self.width, default_val=self._default_val)
+        grid._grid = self._grid.copy()
+        return grid
 
     # TODO: add __deepcopy__() method
 
-    def __repr__(self):
-        return (f"{type(self).__name__}("
-                f"{self.height}, "
-                f"{self.width}, "
-                f"default_val={self._default_val}, "
-                f"data={self._grid}"
-                f")")
 
-    def __str__(self):
-        # TODO can I write a smart __str__ that makes a nice grid?
-        return str([list(r) for r in self.rows()])
+def _toggle_bits(masks, diff, bit):
+    """Toggle `bit` in ``masks[i]`` for every bit *i* that is set in `diff`."""
+    while diff:
+        low = diff & -diff
+        masks[low.bit_length() - 1] ^= bit
+        diff ^= low
+
+
+class NonogridBitset(Nonogrid):
+    """Nonogrid of booleans implemented with an integer bitmask for each row and each column.
+
+    Notes
+    -----
+    Bit *c* of the mask for row *r* is set if and only if square ``(r, c)`` is filled,
+    which is the layout :py:meth:`~nonogram.gram.Nonoclue.satisfied_by_mask` verifies,
+    so :py:meth:`~NonogridBitset.row_masks` does not need to pack any squares.
+
+    The column masks are kept up to date on every write (each write to a square
+    flips one bit in its row and one in its column), so :py:meth:`~NonogridBitset.col_masks`
+    does not transpose the grid either.
+
+    Squares store only the truthiness of the values written to them and read back as booleans.
+    """
+
+    __slots__ = ("_rows", "_cols")
+
+    def __init__(self, height, width, data=(), *, default_val=False):
+        """Initialize a nonogrid and optionally fill in initial data.
+
+        See :py:meth:`NonogridArray.__init__` for parameter details.
+        Values in `data` and `default_val` are cast to booleans immediately.
+        """
+        super().__init__(height, width, default_val=bool(default_val))
+        rows = islice(chain(data, repeat(())), self.height)
+        self._rows = [pack_mask(islice(chain(row, repeat(default_val)), self.width))
+                      for row in rows]
+        self._cols = _transpose_masks(self._rows, self.width)
+
+    @classmethod
+    def from_masks(cls, height, width, row_masks):
+        """Initialize a nonogrid directly from the bitmask of each row.
+
+        Bits past `width` are cleared, and rows missing from `row_masks` are empty.
+        """
+        grid = cls(height, width)
+        full = (1 << width) - 1
+        grid._rows = [mask & full for mask in islice(chain(row_masks, repeat(0)), height)]
+        grid._cols = _transpose_masks(grid._rows, width)
+        return grid
+
+    def __getitem__(self, idx: tuple[int, int]):
+        r, c = idx
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise IndexError(f"Index (row={r}, col={c}) invalid for grid dimensions {self.dims}")
+        return self._rows[r] >> c & 1 == 1
+
+    def __setitem__(self, idx: tuple[int, int], val):
+        r, c = idx
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise IndexError(f"Index (row={r}, col={c}) invalid for grid dimensions {self.dims}")
+        self._set(r, c, val)
+
+    def _get(self, r, c):
+        return self._rows[r] >> c & 1 == 1
+
+    def _set(self, r, c, val):
+        if val:
+            self._rows[r] |= 1 << c
+            self._cols[c] |= 1 << r
+        else:
+            self._rows[r] &= ~(1 << c)
+            self._cols[c] &= ~(1 << r)
+
+    def row(self, r):
+        """List of the values in the row at a given index."""
+        self._validate_line(r, self.height, "row")
+        return unpack_mask(self._rows[r], self.width)
+
+    def col(self, c):
+        """List of the values in the column at a given index."""
+        self._validate_line(c, self.width, "col")
+        return unpack_mask(self._cols[c], self.height)
+
+    def rows(self):
+        """Iterate over all rows in the grid.
+
+        Unpacks the stored row masks directly instead of validating every row index.
+        """
+        return map(unpack_mask, self._rows, repeat(self.width))
+
+    def cols(self):
+        """Iterate over all columns in the grid.
+
+        Unpacks the stored column masks directly instead of validating every column index.
+        """
+        return map(unpack_mask, self._cols, repeat(self.height))
+
+    def set_row(self, r, data, default_val=None):
+        """Fill a row with values from an iterable.
+
+        Only the columns whose square in the row changes are updated.
+        See :py:meth:`Nonogrid.set_row` for parameter details.
+        """
+        self._validate_line(r, self.height, "row")
+        pad = self._default_val if default_val is None else default_val
+        mask = pack_mask(islice(chain(data, repeat(pad)), self.width))
+        _toggle_bits(self._cols, self._rows[r] ^ mask, 1 << r)
+        self._rows[r] = mask
+
+    def set_col(self, c, data, default_val=None):
+        """Fill a column with values from an iterable.
+
+        Only the rows whose square in the column changes are updated.
+        See :py:meth:`Nonogrid.set_col` for parameter details.
+        """
+        self._validate_line(c, self.width, "col")
+        pad = self._default_val if default_val is None else default_val
+        # islice stops at the last row before pulling another value out of `data`
+        mask = pack_mask(islice(chain(data, repeat(pad)), self.height))
+        _toggle_bits(self._rows, self._cols[c] ^ mask, 1 << c)
+        self._cols[c] = mask
+
+    def row_mask(self, r):
+        """Stored mask of the row at a given index; see :py:meth:`Nonogrid.row_mask`."""
+        self._validate_line(r, self.height, "row")
+        return self._rows[r]
+
+    def col_mask(self, c):
+        """Stored mask of the column at a given index; see :py:meth:`Nonogrid.col_mask`."""
+        self._validate_line(c, self.width, "col")
+        return self._cols[c]
+
+    def row_masks(self):
+        """List of every row packed into an integer with bit *c* set if square *c* is filled.
+
+        Copies the stored masks.
+        """
+        return self._rows.copy()
+
+    def col_masks(self):
+        """List of every column packed into an integer with bit *r* set if square *r* is filled.
+
+        Copies the stored masks.
+        """
+        return self._cols.copy()
+
+    def line_masks(self):
+        """Lists of every row mask and every column mask.
+
+        Copies the stored masks.
+        """
+        return self._rows.copy(), self._cols.copy()
+
+    def __copy__(self):
+        grid = type(self)(0, 0, default_val=self._default_val)
+        grid.height, grid.width = self.height, self.width
+        grid._rows, grid._cols = self._rows.copy(), self._cols.copy()
+        return grid
+
 
 # TODO: Add implementation of Nonogrid for sparse grams.
@@ -0,0 +1,95 @@
+"""Integer bitmask representations of the lines of a nonogram.
+
+A line of squares is represented by an integer where bit *i* is set if and only if square *i*
+is filled, and a clue by the tuple of its hints (:py:attr:`Nonoclue.clue
+<nonogram.gram.Nonoclue.clue>`).
+The puzzle and grid representations share these functions with the solvers,
+so that they do not depend on :py:mod:`nonogram.solve`.
+"""
+
+from functools import cache, lru_cache
+from itertools import chain, compress, islice
+from math import comb
+
+
+_SQUARE_BITS = [1 << i for i in range(64)]
+"""Bit for each square index, extended on demand by :py:func:`pack_mask`."""
+
+
+def pack_mask(sequence):
+    """Pack a boolean sequence into an integer with bit *i* set if square *i* is filled.
+
+    The inverse of :py:func:`unpack_mask`.
+
+    Notes
+    -----
+    Selects the bits of the filled squares from a table and sums them,
+    so the truth test and the packing both run at C level instead of once per square
+    in the interpreter.
+    (The bits are distinct powers of two, so summing them is the same as or-ing them.)
+    """
+    squares = sequence if isinstance(sequence, (list, tuple)) else list(sequence)
+    if len(squares) > len(_SQUARE_BITS):
+        _SQUARE_BITS.extend(1 << i for i in range(len(_SQUARE_BITS), len(squares)))
+    return sum(compress(_SQUARE_BITS, squares))
+
+
+_BYTE_SQUARES = [tuple(byte >> i & 1 == 1 for i in range(8)) for byte in range(256)]
+"""Squares of every byte as booleans, with bit 0 first."""
+
+
+def unpack_mask(mask, length):
+    """List of `length` booleans where square *i* is ``True`` if bit *i* of `mask` is set.
+
+    Notes
+    -----
+    Converts the mask to little-endian bytes and looks up eight squares per byte,
+    so no bytecode runs per square.
+    """
+    squares = chain.from_iterable(map(_BYTE_SQUARES.__getitem__,
+                                      mask.to_bytes((length + 7) // 8, "little")))
+    return list(islice(squares, length))
+
+
+@cache
+def num_solutions(hints, length):
+    """Number of lines of `length` squares that satisfy `hints`.
+
+    See :py:meth:`ClueSolutions.__len__ <nonogram.solve.utils.ClueSolutions.__len__>`
+    for the derivation.
+    """
+    if (num_objects := length + 2 - sum(hints)) < 1:
+        return 0
+    return comb(num_objects - 1, len(hints))
+
+
+@lru_cache(maxsize=1 << 12)
+def solution_masks(hints, length):
+    """Tuple of the masks of every line of `length` squares that satisfies `hints`.
+
+    The masks are in the order of :py:meth:`ClueSolutions.__iter__
+    <nonogram.solve.utils.ClueSolutions.__iter__>`.
+
+    Notes
+    -----
+    The masks are assembled from the masks of the clue without its first hint,
+    shifted past each start of the first line in turn.
+    This yields the same order, since the first line is placed before the others are moved,
+    and the masks of each suffix of the clue are enumerated only once.
+    """
+    if not hints:
+        return (0,)
+    rest = hints[1:]
+    fill, skip = (1 << hints[0]) - 1, hints[0] + 1
+    masks = []
+    # the last start leaves exactly enough squares for the rest of the lines and their gaps
+    for start in range(length + 1 - sum(hints) - len(rest)):
+        head, shift = fill << start, start + skip
+        masks.extend([head | (mask << shift) for mask in solution_masks(rest, length - shift)])
+    return tuple(masks)
+
+
+@cache
+def solution_mask_set(hints, length):
+    """Frozen set of :py:func:`solution_masks`, for verifying lines by membership."""
+    return frozenset(solution_masks(hints, length))
@@ -1,3 +1,3 @@
 
 from .abc import SolveFailure, NonogramBounder, NonogramSolver
-from .detsearch import ClueChooser
+from .detsearch import ClueChooser, LinePropagator, ParallelLinePropagator
@@ -134,6 +134,8 @@ class NonogramBounder(ABC):
     There is no abstract class which searches for a solution and
     """
 
+    __slots__ = ("nonogram",)
+
     def __init__(self, nonogram: Nonogram):
         """Initialize a solver with a nonogram.
 
@@ -241,6 +243,8 @@ class NonogramSolver(NonogramBounder, ABC):
     a nonogram or fails to maximally satisfy a nonogram, **it is considered a bug**.
     """
 
+    __slots__ = ()
+
     def solve(self,
               *,
               collect: bool = False,
@@ -262,11 +266,10 @@ class NonogramSolver(NonogramBounder, ABC):
         :py:attr:`SolveFailure.DNE`
             If the nonogram is unsolvable.
         """
-        if (result := super().solve(collect=collect)) == SolveFailure.INC:
-            return SolveFailure.DNE
-        # TODO: PyCharm's typechecker is broken or this is bugged?
-        # noinspection PyTypeChecker
-        return result
+        # A maximal max_sat proves nonexistence, so this is NonogramBounder.solve
+        # with DNE in place of INC.
+        n_sat, result = self.max_sat(collect=collect)
+        return result if n_sat == self.nonogram.num_clues else SolveFailure.DNE
 
     @abstractmethod
     def max_sat(self,
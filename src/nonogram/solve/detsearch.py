@@ -1,52 +1,141 @@
 """Nonogram solvers that search a space which must contain the solution if one exists."""
 
-from itertools import product
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cache, reduce
+from itertools import repeat
+from operator import and_, contains, getitem, or_
+from sys import byteorder
 
-from nonogram import Nonogram, NonogridArray
+from nonogram import Nonogram, NonogridBitset
 from nonogram.solve.abc import SolveFailure, NonogramSolver
 from nonogram.solve.utils import ClueSolutions
 
 
-# TODO: Add branch and bound optimizations to both these classes.
+_LANE_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+""":py:meth:`memoryview.cast` format for each number of bytes a packed line can take."""
+
+
+def _lane_unpacker(length, num_lanes):
+    """Lane width that fits a line of `length` squares, and a function that unpacks lanes.
+
+    Returns
+    -------
+    (lane_bits : int, unpack : Callable[[int], Sequence[int]])
+        ``unpack(packed)`` is the sequence of the first `num_lanes` lanes of `packed`,
+        where lane *i* is bits ``i * lane_bits`` to ``(i + 1) * lane_bits - 1``.
+
+    Notes
+    -----
+    Lanes that fit a format of :py:data:`_LANE_FORMATS` are unpacked at C level by
+    :py:meth:`int.to_bytes` and :py:meth:`memoryview.cast`.
+    Lines longer than 64 squares fit none of them, so their lanes are shifted out one by one.
+    """
+    lane_bytes = next((size for size in _LANE_FORMATS if length <= 8 * size), None)
+    if lane_bytes is not None:
+        nbytes, fmt = lane_bytes * num_lanes, _LANE_FORMATS[lane_bytes]
+        return 8 * lane_bytes, (
+            lambda packed: memoryview(packed.to_bytes(nbytes, byteorder)).cast(fmt))
+    lane_bits = length
+    lane, shifts = (1 << lane_bits) - 1, range(0, lane_bits * num_lanes, lane_bits)
+    return lane_bits, lambda packed: [packed >> shift & lane for shift in shifts]
+
+
+def _spread_mask(mask, lane_bits):
+    """Move bit *i* of `mask` to bit ``i * lane_bits``."""
+    return sum(1 << (i * lane_bits) for i in range(mask.bit_length()) if mask >> i & 1)
+
+
+def _grid(nonogram, row_masks):
+    """Grid of `nonogram` whose rows are `row_masks`.
+
+    The solvers already hold every row as a mask, so the masks are stored as they are.
+    """
+    return NonogridBitset.from_masks(nonogram.height, nonogram.width, row_masks)
+
+
+def _prefix_sets(clues, length):
+    """Masks of the first *k* squares of every solution to every clue, for each *k*.
+
+    ``_prefix_sets(clues, length)[k][i]`` holds the prefixes of length *k* of the solutions
+    of length `length` to ``clues[i]``, so a partially fixed line can still be solved
+    if and only if its fixed squares are in the set.
+    """
+    sols = [ClueSolutions(clue, length).mask_set() for clue in clues]
+    return [[frozenset(sol & (1 << k) - 1 for sol in line_sols) for line_sols in sols]
+            for k in range(length + 1)]
+
+
 class ClueChooser(NonogramSolver):
-    """Solver which iterates over possible grid combinations by fixing individual clues."""
+    """Solver which iterates over possible grid combinations by fixing individual clues.
 
-    class _FoundSolution(Exception):
-        """Helper class to end recursion early."""
+    Notes
+    -----
+    Lines of any length are supported, but the perpendicular lines are only unpacked at C level
+    while there are at most 64 fixed lines; see :py:func:`_lane_unpacker`.
+    """
+
+    __slots__ = ()
 
     @staticmethod
     def _num_combs(clue_lst, length):
         """Return number of possible solutions to the clues."""
         prod = 1
         for clue in clue_lst:  # clue_lst should never be empty
-            prod *= len(ClueSolutions(clue, length))
+            if not (num_sols := len(ClueSolutions(clue, length))):
+                return 0  # no need to multiply out the other clues
+            prod *= num_sols
         return prod
 
-    # TODO: Refactor this solution method to use class attributes?
-    def _find_solution_rec(self, grid_builder, cur_idx, row_sols, collector, collect):
-        for sol in row_sols[cur_idx]:
-            grid_builder.append(sol)
-            if cur_idx + 1 == self.nonogram.height:
-                grid = NonogridArray(self.nonogram.height, self.nonogram.width, grid_builder)
-                if self.nonogram.satisfied_by(grid):
-                    collector.append(grid)
-                    if not collect:
-                        raise ClueChooser._FoundSolution()
-            else:
-                self._find_solution_rec(grid_builder,
-                                        cur_idx + 1,
-                                        row_sols,
-                                        collector,
-                                        collect)
-            grid_builder.pop()
-
-    def _find_solution(self, collect):
-        row_sols = [ClueSolutions(row, self.nonogram.width) for row in self.nonogram.rows]
-        collector = []
-        try:
-            self._find_solution_rec([], 0, row_sols, collector, collect)
-        except ClueChooser._FoundSolution:
-            return collector[0]
+    def _find_solution(self, collect, transposed):
+        """List the solutions found by fixing the clues of the rows, or the columns if `transposed`.
+
+        Notes
+        -----
+        The solutions of each fixed clue are enumerated once as masks, and the search fixes
+        one line at a time, depth first.
+        The perpendicular lines are packed into lanes (see :py:func:`_lane_unpacker`) like in
+        :py:meth:`NaiveSolver._best_candidates`, so fixing a line is a single addition.
+        After every line, each perpendicular line is checked against the prefixes of the
+        solutions to its clue (see :py:func:`_prefix_sets`), so a branch is abandoned as soon as
+        some perpendicular clue can no longer be satisfied instead of only at the last line.
+        The fixed lines satisfy their clues by construction,
+        and the last check compares the perpendicular lines against their full solutions.
+        """
+        gram = self.nonogram
+        if transposed:
+            clues, length, other_clues = gram.cols, gram.height, gram.rows
+        else:
+            clues, length, other_clues = gram.rows, gram.width, gram.cols
+        num_lines = len(clues)
+        lane_bits, unpack = _lane_unpacker(num_lines, length)
+
+        line_sols = [ClueSolutions(clue, length).masks() for clue in clues]
+        line_words = [[(mask, _spread_mask(mask, lane_bits) << idx) for mask in sols]
+                      for idx, sols in enumerate(line_sols)]
+        prefixes = _prefix_sets(other_clues, num_lines)
+        collector, fixed = [], []
+
+        def search(depth, packed):
+            """Fix the line at index `depth`; returns ``True`` to stop early."""
+            for mask, word in line_words[depth]:
+                other_masks = unpack(packed + word)
+                if not all(map(contains, prefixes[depth + 1], other_masks)):
+                    continue
+                fixed.append(mask)
+                if depth + 1 < num_lines:
+                    stop = search(depth + 1, packed + word)
+                else:
+                    # the fixed lines are columns instead of rows when transposed
+                    row_masks = list(other_masks) if transposed else fixed
+                    collector.append(_grid(self.nonogram, row_masks))
+                    stop = not collect
+                fixed.pop()
+                if stop:
+                    return True
+            return False
+
+        search(0, 0)
         return collector
 
     def solve(self, *, collect=False):
@@ -55,16 +144,11 @@ class ClueChooser(NonogramSolver):
         if 0 in {row_leaves, col_leaves}:
             return SolveFailure.DNE
 
-        if col_leaves > row_leaves:
-            ...
-            # transposed_gram = Nonogram(self.nonogram.cols, self.nonogram.rows)
-            # transposed_solver = type(self)(transposed_gram)
-            # transposed_result = transposed_solver.solve(collect=collect)
-            # transposed_sols = [sols]
-
-        if not (result := self._find_solution(collect)):
+        # Fix the clues of whichever axis has fewer combinations of solutions.
+        # Swapping the axes locally avoids building a transposed nonogram and solver.
+        if not (result := self._find_solution(collect, transposed=col_leaves < row_leaves)):
             return SolveFailure.DNE
-        return result
+        return result if collect else result[0]
 
     def max_sat(self, *, collect=False):
         # TODO: I think a generalization of the above algorithm exists
@@ -74,31 +158,549 @@ class ClueChooser(NonogramSolver):
 
 
 class NaiveSolver(NonogramSolver):
-    """Solver which finds solutions with unconstrained iteration over grid combinations."""
+    """Solver which finds solutions by iterating over grid combinations row by row.
+
+    Notes
+    -----
+    The grids are searched depth first, fixing one row at a time,
+    and a branch is pruned once the clues its grids could still satisfy cannot beat
+    the best grid found so far: the satisfied row clues of the fixed rows, one clue for every
+    remaining row, and every column clue that some solution still starts like.
+    :py:meth:`solve` only wants grids that satisfy every clue,
+    so it prunes as soon as a single clue is violated.
+    """
+
+    __slots__ = ()
 
     def solve(self, *, collect=False):
-        frac_sat, sol = self.max_sat(collect=collect)
-        if frac_sat == len(self.nonogram.rows) + len(self.nonogram.cols):
+        num_clues = len(self.nonogram.rows) + len(self.nonogram.cols)
+        frac_sat, sol = self._result(*self._search(num_clues), collect)
+        if frac_sat == num_clues:
             return sol
         else:
             return SolveFailure.DNE
 
-    def _grid_iterator(self):
-        rows = product([False, True], repeat=self.nonogram.width)
-        grid_data = product(list(rows), repeat=self.nonogram.height)
-        for data in grid_data:
-            yield NonogridArray.for_nonogram(self.nonogram, data)
+    def _row_masks(self):
+        """Every mask of a row, ordered like ``product([False, True], repeat=width)``.
 
-    def max_sat(self, *, collect=False):
-        maxim_num, maxim_list = 0, []
-        for grid in self._grid_iterator():
-            clue_sat = self.nonogram.satisfied_count(grid)
-            # if list(grid.rows())[0] == [True, False, True]:
-            #     print(clue_sat)
-            if clue_sat == maxim_num:
-                maxim_list.append(grid)
-            if clue_sat > maxim_num:
-                maxim_num, maxim_list = clue_sat, [grid]
+        In this order the first square of a row changes the least often.
+        """
+        width = self.nonogram.width
+        return [int(format(k, f"0{width}b")[::-1], 2) for k in range(1 << width)]
+
+    def _row_words(self, masks, lane_bits):
+        """Word of every mask in `masks` for every row; see :py:meth:`_best_candidates`."""
+        width = self.nonogram.width
+        shift = lane_bits * width
+        # every mask of a row is enumerated anyway, so its solutions are few enough for a set
+        row_sets = [ClueSolutions(clue, width).mask_set() for clue in self.nonogram.rows]
+        return [[(_spread_mask(mask, lane_bits) << r) + ((mask in row_set) << shift)
+                 for mask in masks] for r, row_set in enumerate(row_sets)]
+
+    def _best_candidates(self, first_rows, target=0):
+        """Search every grid whose first row has its mask at an index in `first_rows`.
+
+        Parameters
+        ----------
+        first_rows : Iterable[int]
+            Indices into :py:meth:`_row_masks` of the masks the first row can take.
+        target : int, default=0
+            Number of satisfied clues below which grids are not wanted, so branches that cannot
+            reach it are pruned even before any grid is found.
+
+        Returns
+        -------
+        (int, list[list[int]])
+            The largest number of clues satisfied by any of these grids,
+            and the row masks of every grid that satisfies that many, in enumeration order.
+            Only meaningful if the number is at least `target`.
+
+        Notes
+        -----
+        Every mask of every row is precomputed as a *word*, so that candidates are sums of
+        words and are never built as grids.
+        The word of a mask in row *r* sets bit *r* of the lane of every filled square,
+        where the lane of column *c* is the *c*-th group of bits that fits a column mask,
+        and stores the number of row clues the mask satisfies (0 or 1) above every lane.
+        Since no two words of a grid share a lane bit, adding a row never carries,
+        so one addition counts the satisfied row clues and packs every column mask,
+        which :py:func:`_lane_unpacker` then unpacks, at C level for columns of up to 64 squares.
+        """
+        gram = self.nonogram
+        height = gram.height
+        lane_bits, unpack = _lane_unpacker(height, gram.width)
+        shift = lane_bits * gram.width
+        lanes = (1 << shift) - 1
+
+        masks = self._row_masks()
+        row_words = self._row_words(masks, lane_bits)
+        decoders = [dict(zip(words, masks)) for words in row_words]
+        row_words[0] = [row_words[0][idx] for idx in first_rows]
+        prefixes = _prefix_sets(gram.cols, height)
+        maxim_num, maxim_list, words = 0, [], []
+
+        def bound(depth, packed):
+            """Most clues that a grid of rows starting with the packed rows can satisfy."""
+            col_masks = unpack(packed & lanes)
+            return ((packed >> shift) + height - depth
+                    + sum(map(contains, prefixes[depth], col_masks)))
+
+        col_sols, width = prefixes[height], gram.width
+
+        def search(depth, packed):
+            nonlocal maxim_num, maxim_list
+            threshold = max(maxim_num, target)
+            if depth == height - 1:
+                # Most of the search is spent on the last row, so score its grids inline
+                # instead of calling bound once for every grid.
+                for word in row_words[depth]:
+                    grid = packed + word
+                    # Skip unpacking the columns if even satisfying all of them is not enough.
+                    if (row_sat := grid >> shift) + width < threshold:
+                        continue
+                    col_masks = unpack(grid & lanes)
+                    if (clue_sat := row_sat + sum(map(contains, col_sols, col_masks))) < threshold:
+                        continue
+                    if clue_sat > maxim_num:
+                        maxim_num, maxim_list, threshold = clue_sat, [], clue_sat
+                    maxim_list.append((*words, word))
+                return
+            for word in row_words[depth]:
+                if bound(depth + 1, packed + word) >= threshold:
+                    words.append(word)
+                    search(depth + 1, packed + word)
+                    words.pop()
+                    threshold = max(maxim_num, target)
+
+        search(0, 0)
+        return maxim_num, [list(map(getitem, decoders, grid_words)) for grid_words in maxim_list]
+
+    def _search(self, target=0):
+        """Search every grid; see :py:meth:`_best_candidates`."""
+        return self._best_candidates(range(1 << self.nonogram.width), target)
+
+    def _result(self, maxim_num, maxim_list, collect):
+        # Only the best candidates are turned into grids.
         if not collect:
-            return maxim_num, maxim_list[0] if maxim_list else SolveFailure.DNE
+            if not maxim_list:
+                return maxim_num, SolveFailure.DNE
+            return maxim_num, _grid(self.nonogram, maxim_list[0])
+        return maxim_num, [_grid(self.nonogram, row_masks) for row_masks in maxim_list]
+
+    def max_sat(self, *, collect=False):
+        return self._result(*self._search(), collect)
+
+
+def _best_naive_candidates(nonogram, first_rows, target):
+    """Run :py:meth:`NaiveSolver._best_candidates` in a worker process."""
+    return NaiveSolver(nonogram)._best_candidates(first_rows, target)
+
+
+_worker_stop = None
+
+
+def _init_worker(stop):
+    global _worker_stop
+    _worker_stop = stop
+
+
+class _ParallelSolver(NonogramSolver):
+    """Base of the solvers that split their search between worker processes.
+
+    Subclasses declare the ``max_workers`` slot themselves,
+    since a slot declared here would conflict with the slots of their sequential base.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, nonogram: Nonogram, max_workers: int | None = None):
+        """Initialize a solver with a nonogram.
+
+        Parameters
+        ----------
+        nonogram
+            Nonogram that this solver will attempt to solve.
+        max_workers
+            Maximum number of worker processes,
+            defaulting to :py:class:`concurrent.futures.ProcessPoolExecutor`'s default.
+        """
+        super().__init__(nonogram)
+        self.max_workers = max_workers
+
+    def _spawn_pool(self):
+        """Start a process pool of at most ``max_workers`` workers and an event to stop them.
+
+        Returns
+        -------
+        tuple[concurrent.futures.ProcessPoolExecutor, multiprocessing.Event]
+            The pool and an event that every worker stores in ``_worker_stop`` when it starts,
+            so that setting it stops the searches of all workers.
+
+        Notes
+        -----
+        Forking from the executor's management thread is unsafe, so workers are always spawned.
+        """
+        context = multiprocessing.get_context("spawn")
+        stop = context.Event()
+        pool = ProcessPoolExecutor(self.max_workers, mp_context=context,
+                                   initializer=_init_worker, initargs=(stop,))
+        return pool, stop
+
+
+class ParallelNaiveSolver(_ParallelSolver, NaiveSolver):
+    """Solver which enumerates the grids of :py:class:`NaiveSolver` in parallel.
+
+    Notes
+    -----
+    Every mask of the first row roots an independent part of the enumeration,
+    so each is enumerated by a separate worker process.
+    Results are merged in the order the masks are enumerated,
+    so the solver returns the same grids as :py:class:`NaiveSolver`.
+
+    Starting the worker processes takes longer than enumerating the grids of most
+    small nonograms, so prefer :py:class:`NaiveSolver` unless the grid has many squares.
+    """
+
+    __slots__ = ("max_workers",)
+
+    def _search(self, target=0):
+        pool, _ = self._spawn_pool()
+        with pool:
+            results = pool.map(_best_naive_candidates, repeat(self.nonogram),
+                               ((idx,) for idx in range(1 << self.nonogram.width)),
+                               repeat(target))
+            maxim_num, maxim_list = 0, []
+            for num, candidates in results:
+                if num == maxim_num:
+                    maxim_list.extend(candidates)
+                if num > maxim_num:
+                    maxim_num, maxim_list = num, candidates
         return maxim_num, maxim_list
+
+
+_MAX_DOMAIN_SIZE = 1 << 12
+"""Most masks a :py:class:`LinePropagator` domain holds before the line is left unenumerated."""
+
+
+def _consistent_masks(hints, length, filled, empty, limit):
+    """Set of the masks that solve `hints` and agree with the known squares, if it is small enough.
+
+    Every mask fills the squares of `filled` and none of `empty`.
+    Returns ``None`` if there are more than `limit` such masks.
+
+    Notes
+    -----
+    The masks are counted before any is built, so a line with too many masks costs
+    a number of steps polynomial in its length instead of `limit` masks.
+    Counting also prunes every placement that cannot be completed out of the enumeration.
+    """
+    # Fewest squares taken by the lines from each hint onwards, including the gaps between them.
+    room = [sum(hints[i:]) + len(hints) - i - 1 for i in range(len(hints))]
+
+    def starts(i, pos):
+        """Squares at or after `pos` where the line of hint `i` can start."""
+        hint = hints[i]
+        for start in range(pos, length - room[i] + 1):
+            if filled >> pos & (1 << (start - pos)) - 1:
+                return  # a filled square would be left in the gap before this line
+            if not (((1 << hint) - 1) << start & empty or filled >> (start + hint) & 1):
+                yield start
+
+    @cache
+    def ways(i, pos):
+        """Number of placements of the lines from hint `i` on at or after square `pos`."""
+        if i == len(hints):
+            return 0 if filled >> pos else 1  # no filled square may follow the last line
+        return sum(ways(i + 1, start + hints[i] + 1) for start in starts(i, pos))
+
+    if ways(0, 0) > limit:
+        return None
+
+    def place(i, pos, mask):
+        if i == len(hints):
+            yield mask
+            return
+        for start in starts(i, pos):
+            if ways(i + 1, end := start + hints[i] + 1):
+                yield from place(i + 1, end, mask | ((1 << hints[i]) - 1) << start)
+
+    return frozenset(place(0, 0, 0)) if ways(0, 0) else frozenset()
+
+
+class LinePropagator(NonogramSolver):
+    """Solver which prunes the solutions to each clue against squares fixed by other clues.
+
+    Notes
+    -----
+    Every row and column keeps a *domain*: the set of masks
+    (see :py:meth:`~nonogram.solve.utils.ClueSolutions.mask_set`) that solve its clue
+    and agree with every square known so far.
+    A square is known once all the masks in the domain of its row (or column) agree on it,
+    which removes masks from the domain of the perpendicular column (or row).
+
+    Propagation repeats until no line learns a new square.
+    Only then does the solver branch, by fixing each mask of the undecided line with the
+    smallest domain in turn and propagating again.
+    Since propagation only removes masks that contradict a known square,
+    no solution is ever pruned.
+
+    Domains are never mutated in place; shrinking a domain replaces it with a new set.
+    So a branch only copies the lists of domains, not the domains themselves.
+
+    A clue with more than :py:data:`_MAX_DOMAIN_SIZE` solutions, such as a sparse clue of
+    a long line, is not enumerated up front.
+    Its domain is instead the pair of masks of the squares known to be filled and empty,
+    and the masks are enumerated once those squares leave few enough of them.
+    If every enumerated line is decided, the solver branches on a single unknown square of
+    an unenumerated line instead of on one of its masks.
+    """
+
+    __slots__ = ("_stop",)
+
+    _ROW, _COL = 0, 1
+
+    def __init__(self, nonogram: Nonogram):
+        super().__init__(nonogram)
+        # Anything with an is_set() method; set by worker processes of ParallelLinePropagator.
+        self._stop = None
+
+    @staticmethod
+    def _settled(domain, full):
+        """Masks of the squares that are filled and empty in every mask of the domain."""
+        if isinstance(domain, tuple):  # unenumerated, so only the known squares are settled
+            return domain
+        return reduce(and_, domain), full & ~reduce(or_, domain)
+
+    def _length(self, axis):
+        return self.nonogram.width if axis == self._ROW else self.nonogram.height
+
+    def _restrict(self, axis, idx, domain, filled, empty):
+        """Domain of a line once the squares of `filled` and `empty` are known.
+
+        Returns `domain` itself if no mask was removed.
+        """
+        if isinstance(domain, tuple):
+            old_filled, old_empty = domain
+            if not (filled & ~old_filled or empty & ~old_empty):
+                return domain
+            filled, empty = filled | old_filled, empty | old_empty
+            clue = (self.nonogram.rows, self.nonogram.cols)[axis][idx]
+            kept = _consistent_masks(clue.clue, self._length(axis), filled, empty,
+                                     _MAX_DOMAIN_SIZE)
+            return (filled, empty) if kept is None else kept
+        kept = frozenset(mask for mask in domain if mask & filled == filled and not mask & empty)
+        return kept if len(kept) < len(domain) else domain
+
+    def _propagate(self, domains, known, pending):
+        """Shrink domains until every known square agrees across both axes.
+
+        Parameters
+        ----------
+        domains : list[list[frozenset[int]]]
+            Domains for each row (``domains[0]``) and each column (``domains[1]``).
+            Modified in place.
+        known : list[list[tuple[int, int]]]
+            Masks of the filled and empty squares already propagated out of each line.
+            Modified in place.
+        pending : set[tuple[int, int]]
+            ``(axis, index)`` of every line whose domain shrank since it last propagated.
+
+        Returns
+        -------
+        bool
+            ``False`` if some domain was emptied, proving this branch has no solution.
+        """
+        full = ((1 << self._length(self._ROW)) - 1, (1 << self._length(self._COL)) - 1)
+
+        while pending:
+            axis, idx = pending.pop()
+            filled, empty = self._settled(domains[axis][idx], full[axis])
+            old_filled, old_empty = known[axis][idx]
+            if filled == old_filled and empty == old_empty:
+                continue
+            known[axis][idx] = filled, empty
+
+            other, bit = 1 - axis, 1 << idx
+            learned = (filled & ~old_filled) | (empty & ~old_empty)
+            while learned:
+                low = learned & -learned
+                learned ^= low
+                other_idx = low.bit_length() - 1
+                known_squares = (bit, 0) if filled & low else (0, bit)
+
+                domain = domains[other][other_idx]
+                kept = self._restrict(other, other_idx, domain, *known_squares)
+                if kept is not domain:
+                    if not kept:
+                        return False
+                    domains[other][other_idx] = kept
+                    pending.add((other, other_idx))
+        return True
+
+    @staticmethod
+    def _initial_domain(clue, length):
+        solutions = ClueSolutions(clue, length)
+        if len(solutions) > _MAX_DOMAIN_SIZE:
+            return 0, 0  # no square is known yet
+        return solutions.mask_set()
+
+    def _initial_state(self):
+        """Domains and known squares after propagating every clue, or ``None`` if unsolvable."""
+        gram = self.nonogram
+        domains = [[self._initial_domain(clue, gram.width) for clue in gram.rows],
+                   [self._initial_domain(clue, gram.height) for clue in gram.cols]]
+        if not all(map(all, domains)):
+            return None
+
+        known = [[(0, 0)] * gram.height, [(0, 0)] * gram.width]
+        pending = {(axis, idx) for axis in (self._ROW, self._COL)
+                   for idx in range(len(domains[axis]))}
+        return (domains, known) if self._propagate(domains, known, pending) else None
+
+    def _branches(self, domains):
+        """Choices that split the search, or ``None`` if every line is decided.
+
+        Returns
+        -------
+        list[tuple[int, int, int, int]] | None
+            ``(axis, index, filled, empty)`` for each choice, fixing the squares of `filled`
+            and `empty` on one line.
+            The choices fix each mask of the undecided enumerated line with the smallest domain,
+            or, if there is none, one unknown square of an unenumerated line to each value.
+        """
+        branch, branch_size, unenumerated = None, 0, None
+        for axis, axis_domains in enumerate(domains):
+            for idx, domain in enumerate(axis_domains):
+                if isinstance(domain, tuple):
+                    unenumerated = unenumerated or (axis, idx)
+                elif 1 < len(domain) and (branch is None or len(domain) < branch_size):
+                    branch, branch_size = (axis, idx), len(domain)
+        if branch is not None:
+            axis, idx = branch
+            full = (1 << self._length(axis)) - 1
+            return [(axis, idx, mask, full & ~mask) for mask in domains[axis][idx]]
+        if unenumerated is not None:
+            axis, idx = unenumerated
+            filled, empty = domains[axis][idx]
+            # some square is unknown, or the masks would have been enumerated
+            unknown = ~(filled | empty)
+            square = unknown & -unknown
+            return [(axis, idx, square, 0), (axis, idx, 0, square)]
+        return None
+
+    def _fix_line(self, domains, known, choice):
+        """Copy the search state with the squares of a choice fixed and propagate it.
+
+        Returns
+        -------
+        (domains, known) | None
+            The propagated copy, or ``None`` if the choice proves there is no solution.
+        """
+        axis, idx, filled, empty = choice
+        branch_domains = [list(axis_domains) for axis_domains in domains]
+        branch_known = [list(axis_known) for axis_known in known]
+        if not (kept := self._restrict(axis, idx, domains[axis][idx], filled, empty)):
+            return None
+        branch_domains[axis][idx] = kept
+        if self._propagate(branch_domains, branch_known, {(axis, idx)}):
+            return branch_domains, branch_known
+        return None
+
+    def _search(self, domains, known, collector, collect):
+        """Depth-first search over propagated domains; returns ``True`` to stop early.
+
+        Appends the row masks of each solution found to `collector`.
+        """
+        if self._stop is not None and self._stop.is_set():
+            return True
+
+        if (choices := self._branches(domains)) is None:
+            # every line is decided, and propagation made them consistent
+            collector.append(tuple(next(iter(domain)) for domain in domains[self._ROW]))
+            return not collect
+
+        for choice in choices:
+            state = self._fix_line(domains, known, choice)
+            if state is not None and self._search(*state, collector, collect):
+                return True
+        return False
+
+    def _result(self, collector, collect):
+        if not collector:
+            return SolveFailure.DNE
+        grids = [_grid(self.nonogram, row_masks) for row_masks in collector]
+        return grids if collect else grids[0]
+
+    def solve(self, *, collect=False):
+        collector = []
+        if (state := self._initial_state()) is not None:
+            self._search(*state, collector, collect)
+        return self._result(collector, collect)
+
+    def max_sat(self, *, collect=False):
+        # Propagation discards every grid that violates a clue,
+        # so it cannot rank grids that only partially satisfy the nonogram.
+        raise NotImplementedError
+
+
+def _search_branch(nonogram, choice, collect):
+    """Search the subtree of a :py:class:`LinePropagator` below a choice of its first branch.
+
+    Runs in a worker process, so it receives and returns only small picklable objects
+    and rebuilds the (cached) domains itself.
+    """
+    solver = LinePropagator(nonogram)
+    solver._stop = _worker_stop
+    collector = []
+    if ((state := solver._initial_state()) is not None and
+            (state := solver._fix_line(*state, choice)) is not None):
+        solver._search(*state, collector, collect)
+    return collector
+
+
+class ParallelLinePropagator(_ParallelSolver, LinePropagator):
+    """Solver which searches the top-level branches of :py:class:`LinePropagator` in parallel.
+
+    Notes
+    -----
+    After the initial propagation, each choice of the first branch (usually a mask in the domain
+    of a line) roots an independent subtree, so each subtree is searched by a separate worker
+    process.
+    A worker only receives the nonogram and the choice at its root;
+    shipping the propagated domains would cost more to pickle than to recompute.
+
+    If `collect` is ``False``, the first solution found by any worker is returned,
+    which is not necessarily the solution :py:class:`LinePropagator` would return.
+    The other workers are told to stop through a shared :py:class:`multiprocessing.Event`.
+    If `collect` is ``True``, the results of the workers are merged in the order of their
+    branches, so the solver returns the same grids in the same order as
+    :py:class:`LinePropagator`.
+
+    Starting the worker processes takes longer than solving most small nonograms,
+    so prefer :py:class:`LinePropagator` unless propagation alone leaves a large search.
+    """
+
+    __slots__ = ("max_workers",)
+
+    def solve(self, *, collect=False):
+        if (state := self._initial_state()) is None:
+            return SolveFailure.DNE
+        domains, known = state
+        if (choices := self._branches(domains)) is None:
+            return self._result([tuple(next(iter(d)) for d in domains[self._ROW])], collect)
+
+        pool, stop = self._spawn_pool()
+        collector = []
+        try:
+            futures = [pool.submit(_search_branch, self.nonogram, choice, collect)
+                       for choice in choices]
+            # Collected solutions are merged in the order of the branches to stay deterministic.
+            for future in futures if collect else as_completed(futures):
+                collector.extend(future.result())
+                if collector and not collect:
+                    stop.set()
+                    break
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+        return self._result(collector, collect)
@@ -1,9 +1,9 @@
 """Classes and functions to assist nonogram solvers."""
 
 import itertools
-import math
 
 from nonogram.gram import Nonoclue
+from nonogram.lines import num_solutions, solution_mask_set, solution_masks, unpack_mask
 
 
 class ClueSolutions:
@@ -96,6 +96,8 @@ class ClueSolutions:
         Proof modified from Chapter 5, Section 3: **Like Objects and Unlike Cells**.
     """
 
+    __slots__ = ("clue", "target_length")
+
     def __init__(self, clue, target_length):
         """Initialize a new iterable for solutions of a specific length.
 
@@ -108,29 +110,9 @@ class ClueSolutions:
     def __repr__(self):
         return f"{type(self).__name__}({repr(self.clue)}, {self.target_length})"
 
-    def _gaps_to_sol(self, gaps):
-        sol = []
-        for empty, filled in zip(gaps,
-                                 self.clue.clue + [0],  # add empty line at the end for fencepost
-                                 strict=True):  # fail fast
-            sol.extend([False] * empty)
-            sol.extend([True] * filled)
-        return sol[1:-1]  # reduce g_0 and g_p by 1
-
     def _iterator(self):
-        """Reusable iteration method.
-
-        See :py:meth:`~ClueSolutions.__iter__` for algorithm and documentation.
-        """
-        # Pycharm's typechecker doesn't know defining __len__ and __getitem__ makes a class iterable?
-        # noinspection PyTypeChecker
-        empty_count = self.target_length + 2 - sum(self.clue)
-        divider_indices = range(1, empty_count)
-        for positions in itertools.combinations(divider_indices, len(self.clue)):
-            # itertools.combinations guarantees that positions is sorted
-            pos_pairs = itertools.pairwise([0] + list(positions) + [empty_count])
-            gap_lengths = [b - a for a, b in pos_pairs]
-            yield self._gaps_to_sol(gap_lengths)
+        # Unpacking the cached masks is cheaper than expanding gap lengths into lists.
+        return map(unpack_mask, self.masks(), itertools.repeat(self.target_length))
 
     def __iter__(self):
         """Iterate over all solutions of the desired length that satisfy the nonoclue.
@@ -192,8 +174,46 @@ class ClueSolutions:
         #  in the iterable loop? Probably.
         return self._iterator()
 
-    # TODO: Run some speed tests, if this computation is a constraining factor
-    #  add caching and/or add a new method that approximates length.
+    def masks(self):
+        """Iterate over all solutions as integer masks.
+
+        Yields
+        ------
+        int
+            Integer with bit *i* set if and only if square *i* of the solution is filled,
+            in the same order that :py:meth:`~ClueSolutions.__iter__` yields solutions.
+
+        Notes
+        -----
+        :py:func:`~nonogram.lines.solution_masks` assembles the masks,
+        in the same order, from the masks of the clue without its first hint.
+        They are cached by the clue's hints and the target length,
+        so every clue that shares them enumerates its solutions only once.
+        """
+        return iter(solution_masks(self.clue.clue, self.target_length))
+
+    def mask_set(self):
+        """Set of all solutions as integer masks.
+
+        Returns
+        -------
+        frozenset[int]
+            Every mask yielded by :py:meth:`~ClueSolutions.masks`.
+
+        Notes
+        -----
+        Solvers check the same few clues against many candidate lines,
+        so membership in this set replaces verifying each candidate with
+        :py:meth:`~nonogram.gram.Nonoclue.satisfied_by_mask`.
+
+        The set is cached by the clue's hints and the target length,
+        so it is only built once for all instances that share them,
+        including repeated clues within a single nonogram.
+        Its size is :py:meth:`len(self) <ClueSolutions.__len__>`,
+        so callers should check that length before requesting the set for wide, sparse clues.
+        """
+        return solution_mask_set(self.clue.clue, self.target_length)
+
     def __len__(self):
         """Number of solutions of length `n` that satisfy the clue.
 
@@ -207,8 +227,8 @@ class ClueSolutions:
         -----
         This method exists to speed up computation of the number of solutions for
         branching and bounding algorithms, since :py:meth:`ClueSolutions.__iter__` is expensive.
+        The count is cached by the clue's hints and the target length,
+        like :py:meth:`~ClueSolutions.mask_set`, since solvers size the same clues repeatedly.
         """
-        # noinspection PyTypeChecker
-        if (num_objects := self.target_length + 2 - sum(self.clue)) < 1:
-            return 0
-        return math.comb(num_objects - 1, len(self.clue))
+        return num_solutions(self.clue.clue, self.target_length)
+
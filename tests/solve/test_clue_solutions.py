@@ -9,10 +9,10 @@ from nonogram.solve.utils import ClueSolutions
 class Initialization(TestCase):
     def test_clue(self):
         target_lengths = [2, 4, 8]
-        for clue_arg in itertools.product([3, 5, 9], repeat=3):
-            nonoclue = Nonoclue(clue_arg)
-            for l in target_lengths:
-                self.assertEqual(ClueSolutions(nonoclue, l).clue, nonoclue)
+        args = [(Nonoclue(clue_arg), l)
+                for clue_arg in itertools.product([3, 5, 9], repeat=3) for l in target_lengths]
+        self.assertEqual([ClueSolutions(nonoclue, l).clue for nonoclue, l in args],
+                         [nonoclue for nonoclue, _ in args])
 
     def test_clue_casting(self):
         for clue_arg in ([4, 5, 7],
@@ -28,11 +28,10 @@ class Initialization(TestCase):
                 self.assertEqual(ClueSolutions(clue, target_len).target_length, target_len)
 
     def test_repr(self):
-        for l in range(5):
-            for clue_arg in itertools.product([1, 5, 10], repeat=3):
-                nonoclue = Nonoclue(clue_arg)
-                self.assertEqual(repr(ClueSolutions(nonoclue, l)),
-                                 f"ClueSolutions({repr(nonoclue)}, {l})")
+        args = [(Nonoclue(clue_arg), l)
+                for l in range(5) for clue_arg in itertools.product([1, 5, 10], repeat=3)]
+        self.assertEqual([repr(ClueSolutions(nonoclue, l)) for nonoclue, l in args],
+                         [f"ClueSolutions({repr(nonoclue)}, {l})" for nonoclue, l in args])
 
 
 class NumSolutionCalculations(TestCase):
@@ -41,12 +40,11 @@ class NumSolutionCalculations(TestCase):
             self.assertEqual(len(ClueSolutions([], l),), 1)
 
     def test_too_short(self):
-        for clue in ([1, 1, 1],
-                     [10],
-                     [7, 1, 3]):
-            for l in range(sum(clue) + len(clue) - 1):
-                with self.subTest(clue=clue, target_length=l):
-                    self.assertEqual(len(ClueSolutions(clue, l)), 0)
+        pairs = [(clue, l) for clue in ([1, 1, 1], [10], [7, 1, 3])
+                 for l in range(sum(clue) + len(clue) - 1)]
+        # keep the inputs beside each count so a failing diff names its clue and length
+        self.assertEqual([(clue, l, len(ClueSolutions(clue, l))) for clue, l in pairs],
+                         [(clue, l, 0) for clue, l in pairs])
 
     def test_exact_fit(self):
         for l in range(1, 6):
@@ -61,3 +59,43 @@ class NumSolutionCalculations(TestCase):
                 ([2, 3], 10, 15),
         ):
             self.assertEqual(len(ClueSolutions(clue, l)), exp_count)
+
+
+class MaskSolutions(TestCase):
+    CASES = (([], 4), ([1], 1), ([1], 5), ([1, 2, 1], 8), ([2, 3], 10), ([3], 2))
+
+    @staticmethod
+    def _to_mask(sol):
+        return sum(1 << i for i, square in enumerate(sol) if square)
+
+    def test_matches_iteration(self):
+        for clue, l in MaskSolutions.CASES:
+            with self.subTest(clue=clue, target_length=l):
+                sols = ClueSolutions(clue, l)
+                self.assertEqual(list(sols.masks()), [self._to_mask(sol) for sol in sols])
+
+    @staticmethod
+    def _divider_masks(hints, target_length):
+        # line j starts at its divider position plus the lengths of the lines before it, minus 1
+        fills = [(1 << hint) - 1 for hint in hints]
+        offsets = list(itertools.accumulate(hints, initial=-1))[:-1]
+        for positions in itertools.combinations(range(1, target_length + 2 - sum(hints)),
+                                                len(hints)):
+            yield sum(fill << (pos + off) for fill, pos, off in zip(fills, positions, offsets))
+
+    def test_matches_dividers(self):
+        for clue in itertools.chain.from_iterable(
+                itertools.product([1, 2, 3], repeat=p) for p in range(1, 5)):
+            for l in range(12):
+                with self.subTest(clue=clue, target_length=l):
+                    sols = ClueSolutions(clue, l)
+                    self.assertEqual(list(sols.masks()), list(self._divider_masks(clue, l)))
+
+    def test_mask_set(self):
+        for clue, l in MaskSolutions.CASES:
+            with self.subTest(clue=clue, target_length=l):
+                sols = ClueSolutions(clue, l)
+                nonoclue = Nonoclue(clue)
+                exp_set = {m for m in range(1 << l) if nonoclue.satisfied_by_mask(m)}
+                self.assertEqual(sols.mask_set(), exp_set)
+                self.assertEqual(len(sols.mask_set()), len(sols))
@@ -0,0 +1,199 @@
+import itertools
+from unittest import TestCase
+
+from nonogram import Nonogram, NonogridBitset
+from nonogram.solve import SolveFailure, ClueChooser, LinePropagator, ParallelLinePropagator
+from nonogram.solve.detsearch import NaiveSolver, ParallelNaiveSolver
+
+from ..utils import NonogramDatasetLoader as Loader
+
+
+def _load_grams(loader):
+    for gram in loader.load()["data"]:
+        yield gram, Nonogram(gram["clues"]["row"], gram["clues"]["col"])
+
+
+def _clues(lines):
+    return [[len(list(run)) for filled, run in itertools.groupby(line) if filled] for line in lines]
+
+
+def _grid_data(grid):
+    return [[int(bool(square)) for square in row] for row in grid.rows()]
+
+
+class LinePropagatorSolve(TestCase):
+    def test_basic_solutions(self):
+        for gram, nonogram in _load_grams(Loader.BASIC):
+            with self.subTest(name=gram["name"]):
+                grid = LinePropagator(nonogram).solve()
+                self.assertEqual(_grid_data(grid), gram["sol"])
+
+    def test_unique_solutions(self):
+        for gram, nonogram in _load_grams(Loader.LARGE_WITH_UNIQUE):
+            with self.subTest(name=gram["name"]):
+                grids = LinePropagator(nonogram).solve(collect=True)
+                self.assertEqual(len(grids), 1)
+                self.assertTrue(nonogram.satisfied_by(grids[0]))
+
+    def test_multiple_solutions(self):
+        nonogram = Nonogram([[1], [1]], [[1], [1]])
+        grids = LinePropagator(nonogram).solve(collect=True)
+        self.assertCountEqual([_grid_data(grid) for grid in grids],
+                              [[[1, 0], [0, 1]], [[0, 1], [1, 0]]])
+        self.assertTrue(nonogram.satisfied_by(LinePropagator(nonogram).solve()))
+
+    def test_no_solution(self):
+        for rows, cols in (([[3]], [[1], [1]]),  # row clue longer than the row
+                           ([[1, 1]], [[1], [1], [1]]),  # contradiction after propagation
+                           ([[1], [1]], [[2], [1]])):  # second column can never be filled
+            with self.subTest(rows=rows, cols=cols):
+                solver = LinePropagator(Nonogram(rows, cols))
+                self.assertIs(solver.solve(), SolveFailure.DNE)
+                self.assertIs(solver.solve(collect=True), SolveFailure.DNE)
+
+    def test_unenumerated_lines(self):
+        # every line has four or five single squares, too many masks to enumerate up front
+        sol = [[int((r + c) % 7 == 0) for c in range(30)] for r in range(30)]
+        nonogram = Nonogram(_clues(sol), _clues(zip(*sol)))
+        self.assertTrue(nonogram.satisfied_by(LinePropagator(nonogram).solve()))
+        # a single long sparse row, decided by its columns alone
+        cols = [[1] if c % 10 == 0 else [] for c in range(64)]
+        grid = LinePropagator(Nonogram([[1] * 7], cols)).solve()
+        self.assertEqual(_grid_data(grid), [[int(c % 10 == 0) for c in range(61)]])
+
+
+class ParallelLinePropagatorSolve(TestCase):
+    def test_unique_solutions(self):
+        for gram, nonogram in _load_grams(Loader.LARGE_WITH_UNIQUE):
+            with self.subTest(name=gram["name"]):
+                grids = ParallelLinePropagator(nonogram, max_workers=2).solve(collect=True)
+                self.assertEqual(len(grids), 1)
+                self.assertTrue(nonogram.satisfied_by(grids[0]))
+
+    def test_multiple_solutions(self):
+        nonogram = Nonogram([[1], [1]], [[1], [1]])
+        solver = ParallelLinePropagator(nonogram, max_workers=2)
+        self.assertEqual(len(solver.solve(collect=True)), 2)
+        self.assertTrue(nonogram.satisfied_by(solver.solve()))
+
+    def test_collect_order(self):
+        # every permutation matrix is a solution, so there are several branches to merge
+        nonogram = Nonogram([[1]] * 4, [[1]] * 4)
+        expected = LinePropagator(nonogram).solve(collect=True)
+        grids = ParallelLinePropagator(nonogram, max_workers=2).solve(collect=True)
+        self.assertEqual(list(map(_grid_data, grids)), list(map(_grid_data, expected)))
+
+    def test_solved_by_propagation(self):
+        for gram, nonogram in _load_grams(Loader.BASIC):
+            with self.subTest(name=gram["name"]):
+                grid = ParallelLinePropagator(nonogram, max_workers=2).solve()
+                self.assertEqual(_grid_data(grid), gram["sol"])
+
+    def test_unenumerated_lines(self):
+        sol = [[int((r + c) % 7 == 0) for c in range(30)] for r in range(30)]
+        nonogram = Nonogram(_clues(sol), _clues(zip(*sol)))
+        solver = ParallelLinePropagator(nonogram, max_workers=2)
+        self.assertTrue(nonogram.satisfied_by(solver.solve()))
+
+    def test_no_solution(self):
+        solver = ParallelLinePropagator(Nonogram([[1, 1]], [[1], [1], [1]]), max_workers=2)
+        self.assertIs(solver.solve(), SolveFailure.DNE)
+
+
+class ClueChooserSolve(TestCase):
+    def test_basic_solutions(self):
+        for gram, nonogram in _load_grams(Loader.BASIC):
+            with self.subTest(name=gram["name"]):
+                grid = ClueChooser(nonogram).solve()
+                self.assertEqual(_grid_data(grid), gram["sol"])
+
+    def test_no_solution(self):
+        for rows, cols in (([[3]], [[1], [1]]),
+                           ([[1, 1]], [[1], [1], [1]])):
+            with self.subTest(rows=rows, cols=cols):
+                self.assertIs(ClueChooser(Nonogram(rows, cols)).solve(), SolveFailure.DNE)
+
+    def test_unique_solutions(self):
+        for gram, nonogram in _load_grams(Loader.LARGE_WITH_UNIQUE):
+            with self.subTest(name=gram["name"]):
+                grids = ClueChooser(nonogram).solve(collect=True)
+                self.assertEqual(len(grids), 1)
+                self.assertTrue(nonogram.satisfied_by(grids[0]))
+
+    def test_transposed(self):
+        # 3^2 combinations of row solutions but only 2^2 of column solutions
+        nonogram = Nonogram([[1], [1]], [[1], [], [1]])
+        grids = ClueChooser(nonogram).solve(collect=True)
+        self.assertCountEqual([_grid_data(grid) for grid in grids],
+                              [[[1, 0, 0], [0, 0, 1]], [[0, 0, 1], [1, 0, 0]]])
+
+    def test_long_lines(self):
+        # 70 fixed lines do not fit any lane format of the packed perpendicular lines
+        for rows, cols in (([[1]] * 70, [[70]]),
+                           ([[70]], [[1]] * 70),
+                           ([[1]] * 35 + [[]] + [[1]] * 34, [[35, 34]])):
+            nonogram = Nonogram(rows, cols)
+            with self.subTest(dims=nonogram.dims):
+                grids = ClueChooser(nonogram).solve(collect=True)
+                self.assertEqual(len(grids), 1)
+                self.assertTrue(nonogram.satisfied_by(grids[0]))
+
+
+class NaiveSolverSolve(TestCase):
+    def test_basic_solutions(self):
+        for gram, nonogram in _load_grams(Loader.BASIC):
+            with self.subTest(name=gram["name"]):
+                grid = NaiveSolver(nonogram).solve()
+                self.assertEqual(_grid_data(grid), gram["sol"])
+
+    def test_max_sat(self):
+        # the row clues can both be satisfied, but only one column clue with them
+        nonogram = Nonogram([[1], [1]], [[2], [2]])
+        self.assertIs(NaiveSolver(nonogram).solve(), SolveFailure.DNE)
+        num_sat, grids = NaiveSolver(nonogram).max_sat(collect=True)
+        self.assertEqual(num_sat, 3)
+        # grids are enumerated with the first square changing the least often
+        self.assertEqual([_grid_data(grid) for grid in grids],
+                         [[[0, 1], [0, 1]], [[1, 0], [1, 0]]])
+
+    def test_max_sat_matches_exhaustive(self):
+        # branches are pruned, but every grid that satisfies the most clues is still found
+        nonogram = Nonogram([[1, 1], [3], [1], [2]], [[2], [1, 1], [3], [1]])
+        solver = NaiveSolver(nonogram)
+        num_sat, grids = solver.max_sat(collect=True)
+        all_grids = [NonogridBitset.from_masks(4, 4, row_masks)
+                     for row_masks in itertools.product(solver._row_masks(), repeat=4)]
+        exp_num_sat = max(map(nonogram.satisfied_count, all_grids))
+        self.assertEqual(num_sat, exp_num_sat)
+        self.assertEqual([_grid_data(grid) for grid in grids],
+                         [_grid_data(grid) for grid in all_grids
+                          if nonogram.satisfied_count(grid) == exp_num_sat])
+
+    def test_tall_grid(self):
+        # columns taller than 8 squares are packed into lanes wider than a byte
+        col = [1, 0, 1, 1, 0, 1, 1, 1, 0, 1]
+        nonogram = Nonogram([[square] for square in col], [[1, 2, 3, 1]])
+        self.assertEqual(_grid_data(NaiveSolver(nonogram).solve()), [[square] for square in col])
+        # columns taller than 64 squares fit no lane format and are unpacked by shifting
+        col = [1] * 35 + [0] + [1] * 34
+        nonogram = Nonogram([[square] for square in col], [[35, 34]])
+        self.assertEqual(_grid_data(NaiveSolver(nonogram).solve()), [[square] for square in col])
+
+
+class ParallelNaiveSolverSolve(TestCase):
+    def test_matches_naive(self):
+        for rows, cols in (([[1], [1]], [[2], [2]]),  # best grids tie
+                           ([[1], [1]], [[1], [1]])):  # two solutions
+            with self.subTest(rows=rows, cols=cols):
+                nonogram = Nonogram(rows, cols)
+                num_sat, grids = ParallelNaiveSolver(nonogram, max_workers=2).max_sat(collect=True)
+                exp_num_sat, exp_grids = NaiveSolver(nonogram).max_sat(collect=True)
+                self.assertEqual(num_sat, exp_num_sat)
+                self.assertEqual([_grid_data(grid) for grid in grids],
+                                 [_grid_data(grid) for grid in exp_grids])
+
+    def test_solution(self):
+        gram = next(gram for gram in Loader.BASIC.load()["data"] if gram["name"] == "3x3 X")
+        nonogram = Nonogram(gram["clues"]["row"], gram["clues"]["col"])
+        grid = ParallelNaiveSolver(nonogram, max_workers=2).solve()
+        self.assertEqual(_grid_data(grid), gram["sol"])
@@ -1,4 +1,5 @@
 
+import functools
 import itertools
 from unittest import TestCase
 
@@ -13,19 +14,42 @@ class Initialization(TestCase):
         for i in range(1, len(full_clue) + 1):
             clue = full_clue[:i]
             with self.subTest(init_arg=clue, as_args=False):
-                self.assertEqual(Nonoclue(clue).clue, clue)
+                self.assertEqual(Nonoclue(clue).clue, tuple(clue))
             with self.subTest(init_arg=clue, as_args=True):
-                self.assertEqual(Nonoclue(*clue).clue, clue)
+                self.assertEqual(Nonoclue(*clue).clue, tuple(clue))
 
     def test_remove_zeros(self):
         exp_clue = [i * 2 + 1 for i in range(5)]
         init_arg = [i if i % 2 == 1 else 0 for i in range(11)]
-        self.assertEqual(Nonoclue(init_arg).clue, exp_clue)
+        self.assertEqual(Nonoclue(init_arg).clue, tuple(exp_clue))
+
+    def test_from_nested(self):
+        self.assertEqual(Nonoclue(1, [2, 0, 3], (4,), 0).clue, (1, 2, 3, 4))
+        self.assertEqual(Nonoclue([[1, 2], 3]).clue, (1, 2, 3))
+        self.assertEqual(Nonoclue([[1, [2]], 3]).clue, (1, 2, 3))
 
     def test_from_mixed(self):
         exp_clue = list(range(1, 11))
         init_args = [0, 1, [2, 3, 4], 0, 0, 5, (6, 0, 7, 0), range(8, 10), 10]
-        self.assertEqual(Nonoclue(*init_args).clue, exp_clue)
+        self.assertEqual(Nonoclue(*init_args).clue, tuple(exp_clue))
+
+    def test_immutable(self):
+        self.assertIsInstance(Nonoclue([1, 2]).clue, tuple)
+        self.assertEqual({Nonoclue(1, 2): "a"}[Nonoclue([1, 2])], "a")
+
+    def test_from_strings_and_iterators(self):
+        self.assertEqual(Nonoclue(["1", 2], "3").clue, (1, 2, 3))
+        self.assertEqual(Nonoclue([(n for n in (1, 2)), [3]]).clue, (1, 2, 3))
+
+    def test_from_nonoclues(self):
+        self.assertEqual(Nonoclue(Nonoclue([1, 2])).clue, (1, 2))
+        self.assertEqual(Nonoclue([Nonoclue([1, 2]), 3]).clue, (1, 2, 3))
+
+    def test_from_bools(self):
+        self.assertEqual(Nonoclue(True, 2).clue, (1, 2))
+        self.assertEqual(Nonoclue([2, False, True]).clue, (2, 1))
+        self.assertIs(type(Nonoclue(True, 2).clue[0]), int)
+        self.assertEqual(repr(Nonoclue(True, 2)), "Nonoclue([1, 2])")
 
 
 class InitializationErrors(TestCase):
@@ -34,16 +58,22 @@ class InitializationErrors(TestCase):
         for i in range(len(clue)):
             # test multiple negative numbers at multiple different positions
             clue[i] = -(i + 1)
-            with self.subTest(init_arg=clue):
+            with self.subTest(init_arg=clue, as_args=False):
                 self.assertRaises(ValueError, Nonoclue, clue)
+            with self.subTest(init_arg=clue, as_args=True):
+                self.assertRaises(ValueError, Nonoclue, *clue)
+            with self.subTest(init_arg=clue, nested=True):
+                self.assertRaises(ValueError, Nonoclue, [clue])
+            with self.subTest(init_arg=clue, nested=True, as_args=True):
+                self.assertRaises(ValueError, Nonoclue, 1, clue)
 
 class DunderMethods(TestCase):
-    def setUp(self):
-        self.all_cases = []
+    @classmethod
+    def setUpClass(cls):
+        # the test methods only read the clues, so one set of instances is shared
         full_clue = list(range(1, 6))
-        for i in range(1, len(full_clue) + 1):
-            clue = full_clue[:i]
-            self.all_cases.append((Nonoclue(clue), clue))
+        cls.all_cases = [(Nonoclue(full_clue[:i]), full_clue[:i])
+                         for i in range(1, len(full_clue) + 1)]
 
     def test_len(self):
         for clue, lst in self.all_cases:
@@ -61,32 +91,32 @@ class DunderMethods(TestCase):
         for (clue_a, _), (clue_b, _) in itertools.permutations(self.all_cases, r=2):
             self.assertNotEqual(clue_a, clue_b)
 
+    def test_hash(self):
+        for clue, lst in self.all_cases:
+            self.assertEqual(hash(clue), hash(Nonoclue(*lst)))
+        self.assertEqual(len({clue for clue, _ in self.all_cases * 2}), len(self.all_cases))
+
     def test_getitem(self):
         for clue, lst in self.all_cases:
             for i, x in enumerate(lst):
                 self.assertEqual(clue[i], lst[i])
 
 
-class SatisfiedBy(TestCase):
-    @staticmethod
-    def _load_satisfactory_cases():
-        basic_grams = Loader.BASIC.load()["data"]
-        all_cases = set()  # remove duplicate clues across nonograms
-        for gram in basic_grams:
-            row_clues = gram["clues"]["row"]
-            col_clues = gram["clues"]["col"]
-            solution = gram["sol"]
-            # turn all of the lists into tuples so they are hashable
-            for i, clue in enumerate(row_clues):
-                row = tuple(solution[i])
-                all_cases.add((tuple(clue), row))
-            for j, clue in enumerate(col_clues):
-                col = tuple([solution[i][j] for i in range(len(solution))])
-                all_cases.add((tuple(clue), col))
-        return all_cases
+@functools.cache
+def _satisfactory_cases():
+    """Load every distinct clue and line of the basic dataset once for all tests."""
+    all_cases = set()  # remove duplicate clues across nonograms
+    for gram in Loader.BASIC.load()["data"]:
+        solution = gram["sol"]
+        # turn all of the lists into tuples so they are hashable
+        all_cases.update(zip(map(tuple, gram["clues"]["row"]), map(tuple, solution)))
+        all_cases.update(zip(map(tuple, gram["clues"]["col"]), zip(*solution)))
+    return frozenset(all_cases)
+
 
+class SatisfiedBy(TestCase):
     def test_satisfactory(self):
-        for clue, sol in SatisfiedBy._load_satisfactory_cases():
+        for clue, sol in _satisfactory_cases():
             with self.subTest(clue=clue, sequence=sol):
                 self.assertTrue(Nonoclue(clue).satisfied_by(sol))
 
@@ -98,6 +128,18 @@ class SatisfiedBy(TestCase):
         for clue in ([1], [1, 1], [2], [2, 1], [1, 2], [3], [4]):
             self.assertFalse(Nonoclue(clue).satisfied_by([True] * 5))
 
+    def test_shorter_than_clue(self):
+        for seq in ([True, True, False, True], iter([True, True, False, True]), []):
+            with self.subTest(sequence=seq):
+                self.assertFalse(Nonoclue(2, 2).satisfied_by(seq))
+        self.assertTrue(Nonoclue(2, 2).satisfied_by(iter([True, True, False, True, True])))
+
+    def test_long_sequence(self):
+        seq = [False] * 100 + [True] * 3 + [False, True]
+        self.assertTrue(Nonoclue(3, 1).satisfied_by(seq))
+        self.assertTrue(Nonoclue(3, 1).satisfied_by(iter(seq)))
+        self.assertFalse(Nonoclue(3).satisfied_by(seq))
+
     def test_unsatisfactory_mismatch(self):
         for seq in itertools.product([False, True], repeat=4):
             seq = tuple(seq)
@@ -113,14 +155,63 @@ class SatisfiedBy(TestCase):
             self.assertFalse(Nonoclue(5).satisfied_by(seq))
 
 
+class SatisfiedByMask(TestCase):
+    @staticmethod
+    def _to_mask(sequence):
+        return sum(1 << i for i, square in enumerate(sequence) if square)
+
+    def test_satisfactory(self):
+        for clue, sol in _satisfactory_cases():
+            with self.subTest(clue=clue, sequence=sol):
+                self.assertTrue(Nonoclue(clue).satisfied_by_mask(self._to_mask(sol)))
+
+    def test_matches_sequence(self):
+        for clue in ([], [1], [2], [1, 1], [1, 2], [2, 1], [3], [1, 1, 1]):
+            nonoclue = Nonoclue(clue)
+            for seq in itertools.product([False, True], repeat=6):
+                with self.subTest(clue=clue, sequence=seq):
+                    self.assertEqual(nonoclue.satisfied_by_mask(self._to_mask(seq)),
+                                     nonoclue.satisfied_by(seq))
+
+    def test_runs(self):
+        for seq in itertools.product([False, True], repeat=7):
+            runs = [len(list(group)) for filled, group in itertools.groupby(seq) if filled]
+            mask = self._to_mask(seq)
+            for clue in ([], [1], [2], [7], [1, 1], [2, 3], [1, 1, 1]):
+                with self.subTest(clue=clue, sequence=seq):
+                    self.assertEqual(Nonoclue(clue).satisfied_by_mask(mask), runs == clue)
+
+    def test_length(self):
+        self.assertTrue(Nonoclue(2, 1).satisfied_by_mask(0b1011, length=4))
+        self.assertTrue(Nonoclue(2, 1).satisfied_by_mask(0b10110, length=5))
+        self.assertFalse(Nonoclue(2, 1).satisfied_by_mask(0b011, length=3))
+        for length in range(7):
+            for seq in itertools.product([False, True], repeat=length):
+                with self.subTest(sequence=seq, length=length):
+                    self.assertEqual(Nonoclue(1, 2).satisfied_by_mask(self._to_mask(seq), length),
+                                     Nonoclue(1, 2).satisfied_by(seq))
+
+    def test_invalid_mask(self):
+        for mask, length in [(-1, None), (-0b1011, 4), (0b1_0011, 4), (0b1, 0), (0b1011, 3)]:
+            with self.subTest(mask=mask, length=length):
+                with self.assertRaises(ValueError):
+                    Nonoclue(2, 1).satisfied_by_mask(mask, length)
+
+    def test_leading_zeros(self):
+        for shift in range(5):
+            with self.subTest(shift=shift):
+                self.assertTrue(Nonoclue(2, 1).satisfied_by_mask(0b1011 << shift))
+                self.assertFalse(Nonoclue(1, 2).satisfied_by_mask(0b1011 << shift))
+
+
 class EmptyNonoclue(TestCase):
     def test_initialization(self):
-        self.assertEqual(Nonoclue([]).clue, [])
-        self.assertEqual(Nonoclue([0]).clue, [])
-        self.assertEqual(Nonoclue([0, 0, 0]).clue, [])
+        self.assertEqual(Nonoclue([]).clue, ())
+        self.assertEqual(Nonoclue([0]).clue, ())
+        self.assertEqual(Nonoclue([0, 0, 0]).clue, ())
 
     def test_satisfied(self):
-        for sol in itertools.product((False, True), repeat=4):
-            with self.subTest(sequence=sol):
-                self.assertEqual(Nonoclue([]).satisfied_by(sol),
-                                 not any(sol))
+        clue = Nonoclue([])
+        sols = list(itertools.product((False, True), repeat=4))
+        # one list comparison reports every mismatching sequence by its index
+        self.assertEqual([clue.satisfied_by(sol) for sol in sols], [not any(sol) for sol in sols])
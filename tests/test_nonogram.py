@@ -0,0 +1,87 @@
+import pickle
+from unittest import TestCase
+
+from nonogram import Nonogram, NonogridArray, NonogridBitset
+from nonogram.gram import Nonoclue
+
+from .utils import NonogramDatasetLoader as Loader
+
+
+def _load_solved_grams():
+    for gram in Loader.BASIC.load()["data"]:
+        nonogram = Nonogram(gram["clues"]["row"], gram["clues"]["col"])
+        yield gram["name"], nonogram, gram["sol"]
+
+
+class Initialization(TestCase):
+    def test_shared_clues(self):
+        nonogram = Nonogram([[1], [2], [1]], [[1], Nonoclue(2), [0, 1]])
+        self.assertIs(nonogram.rows[0], nonogram.rows[2])
+        self.assertIs(nonogram.rows[0], nonogram.cols[0])
+        self.assertIs(nonogram.rows[0], nonogram.cols[2])
+        self.assertIs(nonogram.rows[1], nonogram.cols[1])
+
+    def test_subclass_clues(self):
+        class SubNonoclue(Nonoclue):
+            __slots__ = ()
+
+        clue = SubNonoclue([1])
+        nonogram = Nonogram([clue], [SubNonoclue([1])])
+        self.assertIs(nonogram.rows[0], clue)
+        self.assertIs(nonogram.cols[0], clue)
+        self.assertTrue(nonogram.satisfied_by(NonogridArray(1, 1, [[True]])))
+        # an equal plain clue placed first must not replace the subclass instance
+        nonogram = Nonogram([Nonoclue([1]), [1]], [clue, [1]])
+        self.assertIs(nonogram.cols[0], clue)
+        self.assertIs(type(nonogram.rows[0]), Nonoclue)
+        self.assertIs(nonogram.rows[1], nonogram.rows[0])
+        self.assertIs(nonogram.cols[1], nonogram.rows[0])
+
+    def test_pickle(self):
+        nonogram = Nonogram([[1], [2, 1]], [[1, 1], [1], [1]])
+        unpickled = pickle.loads(pickle.dumps(nonogram))
+        self.assertEqual((unpickled.rows, unpickled.cols), (nonogram.rows, nonogram.cols))
+        self.assertEqual(unpickled.dims, nonogram.dims)
+        self.assertEqual(hash(unpickled.rows[1]), hash(nonogram.rows[1]))
+
+
+class SatisfiedBy(TestCase):
+    def test_solutions(self):
+        for name, nonogram, sol in _load_solved_grams():
+            with self.subTest(name=name):
+                grid = NonogridArray(nonogram.height, nonogram.width, sol)
+                self.assertTrue(nonogram.satisfied_by(grid))
+                self.assertEqual(nonogram.satisfied_count(grid), nonogram.num_clues)
+
+    def test_bitset_solutions(self):
+        for name, nonogram, sol in _load_solved_grams():
+            with self.subTest(name=name):
+                grid = NonogridBitset(nonogram.height, nonogram.width, sol)
+                self.assertTrue(nonogram.satisfied_by(grid))
+
+    def test_flipped_square(self):
+        for name, nonogram, sol in _load_solved_grams():
+            for r in range(nonogram.height):
+                for c in range(nonogram.width):
+                    with self.subTest(name=name, row=r, col=c):
+                        grid = NonogridArray(nonogram.height, nonogram.width, sol)
+                        grid[r, c] = not grid[r, c]
+                        self.assertFalse(nonogram.satisfied_by(grid))
+                        # Flipping one square breaks exactly its row clue and column clue.
+                        self.assertEqual(nonogram.satisfied_count(grid), nonogram.num_clues - 2)
+
+    def test_many_line_solutions(self):
+        # The row clue has too many solutions of length 64 to enumerate into a set.
+        filled = {0, 2, 4, 63}
+        nonogram = Nonogram([[1, 1, 1, 1]], [[1] if c in filled else [] for c in range(64)])
+        grid = NonogridBitset(1, 64, [[c in filled for c in range(64)]])
+        self.assertTrue(nonogram.satisfied_by(grid))
+        grid[0, 3] = True
+        self.assertEqual(nonogram.satisfied_count(grid), nonogram.num_clues - 2)
+
+    def test_mismatched_dims(self):
+        nonogram = Nonogram([[1], [1]], [[1], [1]])
+        for dims in ((1, 2), (2, 1), (3, 3)):
+            with self.subTest(dims=dims):
+                self.assertRaises(ValueError, nonogram.satisfied_count, NonogridArray(*dims))
+                self.assertRaises(ValueError, nonogram.satisfied_by, NonogridArray(*dims))
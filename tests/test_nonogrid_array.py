@@ -1,10 +1,13 @@
 # TODO: Restructure this into tests of the abstract base class
 #  and inherit from those tests to test the array implementation.
 
+import copy
 import itertools
+import operator
 from unittest import TestCase
 
-from nonogram.grid import NonogridArray
+from nonogram import Nonogram
+from nonogram.grid import Nonogrid, NonogridArray
 
 
 class BasicPropertyInitialization(TestCase):
@@ -15,9 +18,16 @@ class BasicPropertyInitialization(TestCase):
         self.assertEqual(grid.height, exp_height)
         self.assertEqual(grid.width, exp_width)
 
+    def test_for_nonogram(self):
+        nonogram = Nonogram([[1], [1], [2]], [[1], [2]])
+        grid = NonogridArray.for_nonogram(nonogram, [[True]], default_val=False)
+        self.assertEqual(grid.dims, nonogram.dims)
+        self.assertEqual(list(grid.rows()), [[True, False], [False, False], [False, False]])
+
     def test_data_input_dims(self):
         max_side = 2 * 2
-        data = [[None] * (max_side // 2)] * (max_side // 2)
+        # immutable rows, so sharing one row object across the grid is safe
+        data = ((None,) * (max_side // 2),) * (max_side // 2)
 
         for exp_height, exp_width in itertools.product(range(max_side), range(max_side)):
             with self.subTest(height=exp_height, width=exp_width):
@@ -25,12 +35,21 @@ class BasicPropertyInitialization(TestCase):
                 self.assertEqual(grid.dims, (exp_height, exp_width))
 
 
+def _grid_squares(grid, bounds):
+    height, width = bounds
+    return [[grid[r, c] for c in range(width)] for r in range(height)]
+
+
+def _expected_squares(data, bounds, exp_default):
+    data_height, data_width = len(data), len(data[0])
+    height, width = bounds
+    return [[data[r][c] if r < data_height and c < data_width else exp_default
+             for c in range(width)] for r in range(height)]
+
+
 def _verify_against_data(testcase, data, bounds, grid, exp_default):
-    for r, c in itertools.product(range(bounds[0]), range(bounds[1])):
-        if r >= len(data) or c >= len(data[0]):
-            testcase.assertEqual(grid[r, c], exp_default)
-        else:
-            testcase.assertEqual(grid[r, c], data[r][c])
+    # one comparison of the whole grid; the list diff locates any mismatching square
+    testcase.assertEqual(_grid_squares(grid, bounds), _expected_squares(data, bounds, exp_default))
 
 
 class GridAccess(TestCase):
@@ -43,14 +62,12 @@ class GridAccess(TestCase):
 
     def test_small_grid_access(self):
         max_side = len(GridAccess.SQUARE_DATA)
-        for exp_height, exp_width in itertools.product(range(max_side), range(max_side)):
-            with self.subTest(height=exp_height, width=exp_width):
-                grid = NonogridArray(exp_height, exp_width, GridAccess.SQUARE_DATA)
-                _verify_against_data(self,
-                                     GridAccess.SQUARE_DATA,
-                                     (exp_height, exp_width),
-                                     grid,
-                                     None)
+        all_dims = list(itertools.product(range(max_side), range(max_side)))
+        # keyed by dims, so a failing diff names every grid that differs
+        self.assertEqual(
+            {dims: _grid_squares(NonogridArray(*dims, GridAccess.SQUARE_DATA), dims)
+             for dims in all_dims},
+            {dims: _expected_squares(GridAccess.SQUARE_DATA, dims, None) for dims in all_dims})
 
     def test_default_val(self):
         side_len = len(GridAccess.SQUARE_DATA) + 1
@@ -68,29 +85,142 @@ class GridManipulation(TestCase):
     def test_change_values(self):
         ...
 
+    def test_independent_rows(self):
+        aliased_data = [[0] * 3] * 3
+        grid = NonogridArray(3, 3, aliased_data, default_val=0)
+        grid[0, 0] = 1
+        self.assertEqual([list(row) for row in grid.rows()], [[1, 0, 0], [0, 0, 0], [0, 0, 0]])
+        self.assertEqual(aliased_data, [[0] * 3] * 3)
+
+    def test_row_col(self):
+        data = GridAccess.SQUARE_DATA
+        grid = NonogridArray(len(data), len(data[0]), data)
+        for i in range(len(data)):
+            with self.subTest(idx=i):
+                self.assertEqual(list(grid.row(i)), data[i])
+                self.assertEqual(list(grid.col(i)), [row[i] for row in data])
+
+    def test_rows_cols(self):
+        data = GridAccess.SQUARE_DATA
+        for height, width in ((5, 5), (2, 4), (4, 2), (3, 0), (0, 3)):
+            with self.subTest(height=height, width=width):
+                grid = NonogridArray(height, width, data)
+                self.assertEqual(list(grid.rows()), [row[:width] for row in data[:height]])
+                self.assertEqual(list(grid.cols()),
+                                 [[row[c] for row in data[:height]] for c in range(width)])
+
+    def test_lines_are_copies(self):
+        grid = NonogridArray(2, 2, [[1, 2], [3, 4]])
+        row, col = grid.row(0), grid.col(0)
+        self.assertEqual((row, col), ([1, 2], [1, 3]))
+        row[0] = col[0] = 0
+        self.assertEqual(grid[0, 0], 1)
+
+    def test_copy(self):
+        grid = NonogridArray(2, 3, [[1, 2, 3], [4, 5, 6]], default_val=0)
+        grid_copy = copy.copy(grid)
+        grid_copy[1, 2] = 7
+        self.assertEqual(list(grid_copy.rows()), [[1, 2, 3], [4, 5, 7]])
+        self.assertEqual(list(grid.rows()), [[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(grid_copy._default_val, 0)
+
+    def test_set_row(self):
+        height, width = 2, 4
+        for row_data, exp_row in (([1, 2, 3, 4], [1, 2, 3, 4]),
+                                  ([1, 2], [1, 2, 0, 0]),
+                                  (range(1, 10), [1, 2, 3, 4])):
+            with self.subTest(row_data=row_data):
+                grid = NonogridArray(height, width, default_val=0)
+                grid.set_row(1, row_data)
+                self.assertEqual(list(grid.row(0)), [0] * width)
+                self.assertEqual(list(grid.row(1)), exp_row)
+
+    def test_set_col(self):
+        height, width = 4, 2
+        for col_data, exp_col in (([1, 2, 3, 4], [1, 2, 3, 4]),
+                                  ([1, 2], [1, 2, 0, 0]),
+                                  (iter(range(1, 10)), [1, 2, 3, 4])):
+            with self.subTest(col_data=col_data):
+                grid = NonogridArray(height, width, default_val=0)
+                grid.set_col(1, col_data)
+                self.assertEqual(list(grid.col(0)), [0] * height)
+                self.assertEqual(list(grid.col(1)), exp_col)
+
+    def test_set_col_leaves_iterator(self):
+        data = iter(range(1, 10))
+        NonogridArray(4, 2, default_val=0).set_col(0, data)
+        self.assertEqual(next(data), 5)
+
+    def test_invalid_line(self):
+        grid = NonogridArray(2, 3)
+        for f, idx in ((grid.row, 2), (grid.row, -1), (grid.col, 3), (grid.col, -1)):
+            with self.subTest(method=f.__name__, idx=idx):
+                self.assertRaises(IndexError, f, idx)
+        for f, idx in ((grid.set_row, 2), (grid.set_row, -1), (grid.set_col, 3), (grid.set_col, -1)):
+            with self.subTest(method=f.__name__, idx=idx):
+                self.assertRaises(IndexError, f, idx, [])
 
-class InvalidAccess(TestCase):
-    @staticmethod
-    def _grid_set(grid, r, c, val):
-        grid[r, c] = val
 
+class InvalidAccess(TestCase):
     @staticmethod
     def _callable_iter_sym(grid, coord_range, fixed_pt):
+        """Yield ``(callable, args)`` accessing `grid` along each axis at every coordinate."""
         for x in coord_range:
-            yield lambda: grid[x, fixed_pt]
-            yield lambda: grid[fixed_pt, x]
-            yield lambda: InvalidAccess._grid_set(grid, x, fixed_pt, None)
-            yield lambda: InvalidAccess._grid_set(grid, fixed_pt, x, None)
+            yield operator.getitem, (grid, (x, fixed_pt))
+            yield operator.getitem, (grid, (fixed_pt, x))
+            yield operator.setitem, (grid, (x, fixed_pt), None)
+            yield operator.setitem, (grid, (fixed_pt, x), None)
 
     def test_invalid_negative(self):
         grid = NonogridArray(0, 0)
-        for f in InvalidAccess._callable_iter_sym(grid, (-2, 0), 0):
-            self.assertRaises(IndexError, f)
+        for f, args in InvalidAccess._callable_iter_sym(grid, (-2, 0), 0):
+            self.assertRaises(IndexError, f, *args)
 
     def test_invalid_outside(self):
         arg_height, arg_width = 1, 1
         grid = NonogridArray(arg_height, arg_width)
-        for f in InvalidAccess._callable_iter_sym(grid,
-                                                  (arg_height, arg_height + 3),
-                                                  0):
-            self.assertRaises(IndexError, f)
+        for f, args in InvalidAccess._callable_iter_sym(grid,
+                                                        (arg_height, arg_height + 3),
+                                                        0):
+            self.assertRaises(IndexError, f, *args)
+
+
+class _DictGrid(Nonogrid):
+    """Minimal nonogrid that only implements indexing, to exercise the default line methods."""
+
+    __slots__ = ("squares",)
+
+    def __init__(self, height, width, *, default_val=None):
+        super().__init__(height, width, default_val=default_val)
+        self.squares = {}
+
+    def __getitem__(self, idx):
+        r, c = idx
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise IndexError(idx)
+        return self.squares.get(idx, self._default_val)
+
+    def __setitem__(self, idx, val):
+        self[idx]  # validate
+        self.squares[idx] = val
+
+
+class DefaultLineMethods(TestCase):
+    def test_matches_array(self):
+        grid, array = _DictGrid(3, 4, default_val=0), NonogridArray(3, 4, default_val=0)
+        for g in (grid, array):
+            g.set_row(0, [1, 2, 3])
+            g.set_col(3, iter(range(4, 10)))
+        self.assertEqual(list(grid.rows()), list(array.rows()))
+        self.assertEqual(list(grid.cols()), list(array.cols()))
+        self.assertEqual(grid.row_masks(), array.row_masks())
+        self.assertEqual(grid.col_masks(), array.col_masks())
+
+    def test_invalid_line(self):
+        grid = _DictGrid(2, 3)
+        for f, idx in ((grid.row, 2), (grid.col, -1)):
+            with self.subTest(method=f.__name__, idx=idx):
+                self.assertRaises(IndexError, f, idx)
+        for f, idx in ((grid.set_row, -1), (grid.set_col, 3)):
+            with self.subTest(method=f.__name__, idx=idx):
+                self.assertRaises(IndexError, f, idx, [])
@@ -0,0 +1,116 @@
+import copy
+import itertools
+from unittest import TestCase
+
+from nonogram.grid import NonogridArray, NonogridBitset
+
+
+DATA = [[1, 0, 1, 1],
+        [0, 0, 0, 0],
+        [1, 1, 0, 1]]
+
+
+class Initialization(TestCase):
+    def test_data(self):
+        grid = NonogridBitset(3, 4, DATA)
+        self.assertEqual(list(grid.rows()), [[bool(x) for x in row] for row in DATA])
+
+    def test_padding(self):
+        for default_val in (False, True):
+            with self.subTest(default_val=default_val):
+                grid = NonogridBitset(4, 5, DATA, default_val=default_val)
+                for r, c in itertools.product(range(4), range(5)):
+                    exp = bool(DATA[r][c]) if r < 3 and c < 4 else default_val
+                    self.assertIs(grid[r, c], exp)
+
+    def test_rows_cols(self):
+        grid = NonogridBitset(3, 4, DATA)
+        self.assertEqual(list(grid.rows()), [grid.row(r) for r in range(3)])
+        self.assertEqual(list(grid.cols()), [grid.col(c) for c in range(4)])
+        self.assertEqual(list(NonogridBitset(2, 0).rows()), [[], []])
+
+    def test_from_masks(self):
+        grid = NonogridBitset.from_masks(3, 4, [0b1101, 0, 0b11011])
+        self.assertEqual(grid.row_masks(), [0b1101, 0, 0b1011])
+
+
+class LineMasks(TestCase):
+    def test_masks(self):
+        grid = NonogridBitset(3, 4, DATA)
+        self.assertEqual(grid.row_masks(), [0b1101, 0, 0b1011])
+        self.assertEqual(grid.col_masks(), [0b101, 0b100, 0b001, 0b101])
+
+    def test_single_masks(self):
+        array, bitset = NonogridArray(3, 4, DATA), NonogridBitset(3, 4, DATA)
+        for grid in (array, bitset):
+            with self.subTest(grid=type(grid).__name__):
+                self.assertEqual([grid.row_mask(r) for r in range(3)], grid.row_masks())
+                self.assertEqual([grid.col_mask(c) for c in range(4)], grid.col_masks())
+                self.assertRaises(IndexError, grid.row_mask, 3)
+                self.assertRaises(IndexError, grid.col_mask, -1)
+
+    def test_empty_dims(self):
+        self.assertEqual(NonogridBitset(0, 3).col_masks(), [0, 0, 0])
+        self.assertEqual(NonogridBitset(3, 0).col_masks(), [])
+
+    def test_matches_array(self):
+        array = NonogridArray(3, 4, DATA)
+        bitset = NonogridBitset(3, 4, DATA)
+        self.assertEqual(array.row_masks(), bitset.row_masks())
+        self.assertEqual(array.col_masks(), bitset.col_masks())
+        self.assertEqual(array.line_masks(), (array.row_masks(), array.col_masks()))
+        self.assertEqual(bitset.line_masks(), (bitset.row_masks(), bitset.col_masks()))
+
+
+class GridManipulation(TestCase):
+    def test_set_square(self):
+        grid = NonogridBitset(3, 4, DATA)
+        grid[0, 0], grid[1, 3] = 0, "filled"
+        self.assertEqual(grid.row_masks(), [0b1100, 0b1000, 0b1011])
+
+    def test_set_row(self):
+        grid = NonogridBitset(3, 4, DATA)
+        grid.set_row(1, [1, 1])
+        grid.set_row(2, [1, 0], default_val=True)
+        self.assertEqual(grid.row_masks(), [0b1101, 0b0011, 0b1101])
+
+    def test_set_col(self):
+        grid = NonogridBitset(3, 4, DATA)
+        data = iter(range(1, 10))
+        grid.set_col(1, data)
+        self.assertEqual(grid.col(1), [True] * 3)
+        self.assertEqual(next(data), 4)
+
+    def test_columns_follow_writes(self):
+        grid, array = NonogridBitset(3, 4, DATA), NonogridArray(3, 4, DATA, default_val=0)
+        for g in (grid, array):
+            g[1, 2] = 1
+            g[0, 0] = 0
+            g.set_row(2, [0, 1, 1])
+            g.set_col(3, [1, 1])
+        self.assertEqual(grid.col_masks(), array.col_masks())
+        self.assertEqual(list(grid.cols()), [[bool(x) for x in col] for col in array.cols()])
+
+    def test_copy(self):
+        grid = NonogridBitset(3, 4, DATA)
+        grid_copy = copy.copy(grid)
+        grid_copy[1, 1] = True
+        self.assertEqual(grid.row_masks(), [0b1101, 0, 0b1011])
+        self.assertEqual(grid_copy.row_masks(), [0b1101, 0b10, 0b1011])
+        self.assertEqual(grid.col_masks(), [0b101, 0b100, 0b001, 0b101])
+        self.assertEqual(grid_copy.col_masks(), [0b101, 0b110, 0b001, 0b101])
+
+
+class InvalidAccess(TestCase):
+    def test_invalid_square(self):
+        grid = NonogridBitset(2, 3)
+        for idx in ((-1, 0), (0, -1), (2, 0), (0, 3)):
+            with self.subTest(idx=idx):
+                self.assertRaises(IndexError, grid.__getitem__, idx)
+                self.assertRaises(IndexError, grid.__setitem__, idx, True)
+
+    def test_invalid_line(self):
+        grid = NonogridBitset(2, 3)
+        for f, idx in ((grid.row, 2), (grid.row, -1), (grid.col, 3), (grid.col, -1)):
+            with self.subTest(method=f.__name__, idx=idx):
+                self.assertRaises(IndexError, f, idx)
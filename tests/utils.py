@@ -1,5 +1,6 @@
 """Utilities for interacting with the nonograms in my JSON files."""
 
+import functools
 import json
 from typing import NamedTuple, Required, Sequence, TypedDict
 from enum import Enum, nonmember
@@ -31,11 +32,20 @@ class NonogramDatasetLoader(Enum):
     BASIC = "basegrams.json"
     LARGE_WITH_UNIQUE = "uniquegrams.json"
 
-    _DATA_FILE_PREFIX = nonmember(Path("tests", "data"))
+    # relative to this file, so the datasets load from any working directory
+    _DATA_FILE_PREFIX = nonmember(Path(__file__).resolve().parent / "data")
 
     def load(self) -> NonogramDataset:
+        """Load the dataset, parsing its file only the first time.
+
+        Every call returns the same object, so callers must not modify it.
+        """
         # noinspection PyUnresolvedReferences
-        filepath = NonogramDatasetLoader._DATA_FILE_PREFIX.joinpath(self.value)
-        with open(filepath, mode="rt") as f:
-            # TODO: why am I not using the classes I made?
-            return json.load(f)
+        return _load_json(NonogramDatasetLoader._DATA_FILE_PREFIX.joinpath(self.value))
+
+
+@functools.cache
+def _load_json(filepath):
+    with open(filepath, mode="rt") as f:
+        # TODO: why am I not using the classes I made?
+        return json.load(f)